@@ -9,15 +9,18 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from persona_sim.core.config import Settings, get_settings
 from persona_sim.db.session import get_sessionmaker
+from persona_sim.db.writer import get_background_writer
 from persona_sim.sim.service import SimulationService
 
 
+@lru_cache(maxsize=1)
 def get_app_settings() -> Settings:
     """Dependency wrapper for application settings."""
 
     return get_settings()
 
 
+@lru_cache(maxsize=1)
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Provide the shared async session factory."""
 
@@ -27,8 +30,7 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
 async def get_db_session() -> AsyncIterator[AsyncSession]:
     """Yield an async database session."""
 
-    session_factory = get_session_factory()
-    async with session_factory() as session:
+    async with get_session_factory()() as session:
         yield session
 
 
@@ -36,4 +38,6 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
 def get_simulation_service() -> SimulationService:
     """Provide a singleton SimulationService wired with the default session factory."""
 
-    return SimulationService(session_factory=get_session_factory())
+    return SimulationService(
+        session_factory=get_session_factory(), writer=get_background_writer()
+    )
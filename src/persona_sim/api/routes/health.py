@@ -1,28 +1,27 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 
 from persona_sim import __version__
-from persona_sim.api.deps import get_app_settings
-from persona_sim.core.config import Settings
-from persona_sim.db import verify_database_connection
+from persona_sim.core.config import get_settings
+from persona_sim.db.health import get_db_health_tracker
 from persona_sim.schemas.system import HealthResponse
 
 router = APIRouter(prefix="/health", tags=["system"])
 
+# Settings are a process-wide singleton; resolving them per probe is pure framework overhead.
+_SETTINGS = get_settings()
+
 
 @router.get("", response_model=HealthResponse, response_model_exclude_none=True)
-async def health(settings: Settings = Depends(get_app_settings)) -> HealthResponse:
+async def health() -> HealthResponse:
     """Simple liveness endpoint with database status."""
 
-    database_status = "ok"
-    try:
-        await verify_database_connection()
-    except Exception:  # pragma: no cover - defensive health guard
-        database_status = "unavailable"
+    database_ok = await get_db_health_tracker().check()
+    database_status = "ok" if database_ok else "unavailable"
 
     status = "ok" if database_status == "ok" else "degraded"
     return HealthResponse(
         status=status,
-        environment=settings.environment,
+        environment=_SETTINGS.environment,
         version=__version__,
         database=database_status,
     )
@@ -5,11 +5,17 @@ from __future__ import annotations
 from http import HTTPStatus
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
 
 from persona_sim.api.deps import get_simulation_service
-from persona_sim.schemas import PersonaSpec, ScenarioSpec, SimulationState, Stimulus
+from persona_sim.schemas import (
+    PersonaSpec,
+    ScenarioSpec,
+    SimulationState,
+    Stimulus,
+    TranscriptPage,
+)
 from persona_sim.sim.errors import NotFoundError, RunFailedError, ValidationError
 from persona_sim.sim.service import SimulationService
 
@@ -160,3 +166,24 @@ async def get_simulation_run(
         return await service.get_run(run_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.get(
+    "/{run_id}/transcript",
+    response_model=TranscriptPage,
+    response_model_exclude_none=True,
+)
+async def get_simulation_transcript(
+    run_id: UUID,
+    since_event_id: int | None = Query(
+        default=None, ge=0, description="Only return events recorded after this cursor."
+    ),
+    limit: int = Query(default=256, ge=1, le=1000, description="Maximum events to return."),
+    service: SimulationService = Depends(get_simulation_service),
+) -> TranscriptPage:
+    """Retrieve transcript events incrementally so polling clients only fetch new entries."""
+
+    try:
+        return await service.get_transcript(run_id, since_event_id=since_event_id, limit=limit)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(exc)) from exc
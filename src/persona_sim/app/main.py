@@ -1,14 +1,39 @@
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
-from fastapi import FastAPI
+import orjson
+import structlog
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
 
 from persona_sim import __version__
 from persona_sim.api.routes.health import router as health_router
 from persona_sim.api.routes.simulations import router as simulations_router
 from persona_sim.core.config import get_settings
 from persona_sim.core.logging import setup_logging
-from persona_sim.db import verify_database_connection
+from persona_sim.db import get_engine, verify_database_connection, warm_connection_pool
+from persona_sim.db.writer import get_background_writer
+from persona_sim.sim.llm.batcher import get_llm_batcher
+
+logger = structlog.get_logger(__name__)
+
+
+def _install_cached_openapi(application: FastAPI) -> None:
+    """Serve the OpenAPI document from bytes rendered once at startup."""
+
+    openapi_url = application.openapi_url
+    if openapi_url is None:
+        return
+
+    schema_bytes = orjson.dumps(application.openapi())
+
+    async def openapi_json(_: Request) -> Response:
+        return Response(content=schema_bytes, media_type="application/json")
+
+    application.router.routes = [
+        route for route in application.router.routes if getattr(route, "path", None) != openapi_url
+    ]
+    application.add_route(openapi_url, openapi_json, include_in_schema=False)
 
 
 def create_app() -> FastAPI:
@@ -19,8 +44,20 @@ def create_app() -> FastAPI:
 
     @asynccontextmanager
     async def lifespan(_: FastAPI) -> AsyncIterator[None]:
-        await verify_database_connection()
-        yield
+        engine = get_engine()
+        await verify_database_connection(engine)
+        await warm_connection_pool(engine)
+        logger.info("database_pool_ready", pool=engine.pool.status())
+        writer = get_background_writer()
+        writer.start()
+        batcher = get_llm_batcher()
+        batcher.start()
+        try:
+            yield
+        finally:
+            await batcher.stop()
+            await writer.stop()
+            await engine.dispose()
 
     application = FastAPI(
         title=settings.app_name,
@@ -28,10 +65,12 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     application.include_router(health_router)
     application.include_router(simulations_router)
+    _install_cached_openapi(application)
 
     return application
 
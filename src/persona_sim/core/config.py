@@ -17,8 +17,19 @@ class Settings(BaseSettings):
     app_name: str = Field(default="persona-sim", alias="APP_NAME")
     environment: str = Field(default="development", alias="APP_ENV")
     database_url: str = Field(default="sqlite+aiosqlite:///./personas.db", alias="DATABASE_URL")
+    db_pool_size: int = Field(default=20, ge=1, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=30, ge=0, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle_seconds: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0, alias="DB_POOL_TIMEOUT_SECONDS")
+    trust_db_payloads: bool = Field(default=False, alias="TRUST_DB_PAYLOADS")
     openai_api_key: str | None = Field(default=None, alias="OPENAI_API_KEY")
     model_name: str = Field(default="gpt-4o-mini", alias="MODEL_NAME")
+    persona_concurrency: int = Field(default=32, ge=1, alias="PERSONA_CONCURRENCY")
+    persona_response_cache_size: int = Field(
+        default=0, ge=0, alias="PERSONA_RESPONSE_CACHE_SIZE"
+    )
+    llm_batch_size: int = Field(default=32, ge=1, alias="LLM_BATCH_SIZE")
+    llm_batch_wait_ms: float = Field(default=0.0, ge=0.0, alias="LLM_BATCH_WAIT_MS")
     default_temperature: float = Field(
         default=0.3, ge=0.0, le=1.0, alias="DEFAULT_TEMPERATURE"
     )
@@ -6,6 +6,7 @@ from persona_sim.db.session import (
     get_session,
     get_sessionmaker,
     verify_database_connection,
+    warm_connection_pool,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "get_session",
     "get_sessionmaker",
     "verify_database_connection",
+    "warm_connection_pool",
 ]
@@ -0,0 +1,72 @@
+"""Database reachability tracking for liveness probes."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from persona_sim.db.session import get_engine, verify_database_connection
+
+_DEFAULT_TTL_SECONDS: Final = 5.0
+
+
+class DBHealthTracker:
+    """Remember a successful connectivity check for a short TTL.
+
+    Probes inside the TTL reuse the last result instead of checking out a connection. Concurrent
+    probes after expiry share a single check, and pool invalidation expires the cached result so
+    genuine outages surface on the next probe.
+    """
+
+    def __init__(self, ttl_seconds: float = _DEFAULT_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._last_ok_monotonic: float | None = None
+        self._lock = asyncio.Lock()
+
+    def watch(self, engine: AsyncEngine) -> None:
+        """Expire the cached status whenever the engine invalidates a pooled connection."""
+
+        event.listen(engine.sync_engine, "invalidate", self._on_invalidate)
+
+    def expire(self) -> None:
+        """Force the next check to hit the database."""
+
+        self._last_ok_monotonic = None
+
+    async def check(self, engine: AsyncEngine | None = None) -> bool:
+        """Return whether the database is reachable, reusing a fresh result when available."""
+
+        if self._is_fresh():
+            return True
+
+        async with self._lock:
+            if self._is_fresh():
+                return True
+            try:
+                await verify_database_connection(engine)
+            except Exception:
+                self.expire()
+                return False
+            self._last_ok_monotonic = monotonic()
+            return True
+
+    def _is_fresh(self) -> bool:
+        last_ok = self._last_ok_monotonic
+        return last_ok is not None and monotonic() - last_ok < self._ttl_seconds
+
+    def _on_invalidate(self, *_: Any) -> None:
+        self.expire()
+
+
+@lru_cache
+def get_db_health_tracker() -> DBHealthTracker:
+    """Return the process-wide tracker bound to the default engine."""
+
+    tracker = DBHealthTracker()
+    tracker.watch(get_engine())
+    return tracker
@@ -4,13 +4,31 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import StrEnum
-from typing import List, Optional
-
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
+from typing import Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Dialect,
+    Float,
+    ForeignKey,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    TypeDecorator,
+    Uuid,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from persona_sim.db.base import Base
 
+# Payload columns are stored pre-parsed: JSONB on PostgreSQL, JSON (text-backed) elsewhere.
+JSONPayload = JSON().with_variant(JSONB, "postgresql")
+
 
 class SimulationStatus(StrEnum):
     """Lifecycle status for a simulation run."""
@@ -21,26 +39,50 @@ class SimulationStatus(StrEnum):
     FAILED = "failed"
 
 
+STATUS_TO_INT: dict[SimulationStatus, int] = {
+    SimulationStatus.CREATED: 0,
+    SimulationStatus.RUNNING: 1,
+    SimulationStatus.COMPLETED: 2,
+    SimulationStatus.FAILED: 3,
+}
+INT_TO_STATUS: dict[int, SimulationStatus] = {
+    code: status for status, code in STATUS_TO_INT.items()
+}
+
+
+class StatusCode(TypeDecorator[SimulationStatus]):
+    """Persist ``SimulationStatus`` as a SMALLINT while exposing the enum to callers."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: SimulationStatus | None, dialect: Dialect) -> int | None:
+        return None if value is None else STATUS_TO_INT[SimulationStatus(value)]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> SimulationStatus | None:
+        return None if value is None else INT_TO_STATUS[value]
+
+
 class SimulationRun(Base):
     """Primary record for a simulation run."""
 
     __tablename__ = "simulation_runs"
 
-    run_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    run_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
-    scenario_json: Mapped[str] = mapped_column(Text, nullable=False)
-    personas_json: Mapped[str] = mapped_column(Text, nullable=False)
+    scenario_json: Mapped[dict[str, Any]] = mapped_column(JSONPayload, nullable=False)
+    personas_json: Mapped[list[dict[str, Any]]] = mapped_column(JSONPayload, nullable=False)
     mode: Mapped[str] = mapped_column(String(50), nullable=False)
     status: Mapped[SimulationStatus] = mapped_column(
-        Enum(SimulationStatus, native_enum=False), nullable=False, default=SimulationStatus.CREATED
+        StatusCode(), nullable=False, default=SimulationStatus.CREATED
     )
     model_name: Mapped[str] = mapped_column(String(100), nullable=False)
     temperature: Mapped[float] = mapped_column(Float, nullable=False)
 
     transcript_events: Mapped[List["TranscriptEvent"]] = relationship(
-        back_populates="run", cascade="all, delete-orphan"
+        back_populates="run", cascade="all, delete-orphan", order_by="TranscriptEvent.id"
     )
     evaluation_report: Mapped[Optional["EvaluationReport"]] = relationship(
         back_populates="run", uselist=False, cascade="all, delete-orphan"
@@ -53,8 +95,8 @@ class TranscriptEvent(Base):
     __tablename__ = "transcript_events"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    run_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("simulation_runs.run_id", ondelete="CASCADE"), nullable=False
+    run_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("simulation_runs.run_id", ondelete="CASCADE"), nullable=False
     )
     timestamp: Mapped[str] = mapped_column(String(50), nullable=False)
     actor: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -70,10 +112,12 @@ class EvaluationReport(Base):
 
     __tablename__ = "evaluation_reports"
 
-    run_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("simulation_runs.run_id", ondelete="CASCADE"), primary_key=True
+    run_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("simulation_runs.run_id", ondelete="CASCADE"),
+        primary_key=True,
     )
-    report_json: Mapped[str] = mapped_column(Text, nullable=False)
+    report_json: Mapped[dict[str, Any]] = mapped_column(JSONPayload, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
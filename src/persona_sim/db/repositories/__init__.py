@@ -2,18 +2,28 @@
 
 from persona_sim.db.repositories.sim_repo import (
     SimulationRunDTO,
+    TranscriptBuffer,
     add_event,
+    add_events_bulk,
     create_run,
     get_run,
+    get_transcript_page,
     save_evaluation,
     set_status,
+    stage_evaluation,
+    stage_status,
 )
 
 __all__ = [
     "SimulationRunDTO",
+    "TranscriptBuffer",
     "create_run",
     "add_event",
+    "add_events_bulk",
     "set_status",
+    "stage_status",
     "save_evaluation",
+    "stage_evaluation",
     "get_run",
+    "get_transcript_page",
 ]
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from types import TracebackType
+from typing import Any, List, Optional
 from uuid import UUID
 
+import orjson
 from pydantic import TypeAdapter
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, insert, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from persona_sim.db.models import (
     EvaluationReport as EvaluationReportModel,
@@ -18,13 +21,34 @@ from persona_sim.db.models import (
     SimulationStatus,
     TranscriptEvent as TranscriptEventModel,
 )
+from persona_sim.db.run_cache import invalidate_run
 from persona_sim.schemas.eval import EvaluationReport
 from persona_sim.schemas.persona import PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
 from persona_sim.schemas.sim_state import SimulationState
-from persona_sim.schemas.transcript import TranscriptEvent
+from persona_sim.schemas.transcript import TranscriptEvent, TranscriptPage
 
 _PERSONA_LIST_ADAPTER = TypeAdapter(List[PersonaSpec])
+_TRANSCRIPT_BATCH_SIZE = 32
+_TRANSCRIPT_PAGE_SIZE = 256
+
+# Hot-path statements are built once; execution only binds parameters.
+_SET_STATUS_STATEMENT = lambda_stmt(
+    lambda: update(SimulationRun)
+    .where(SimulationRun.run_id == bindparam("target_run_id"))
+    .values(status=bindparam("new_status"))
+    .returning(SimulationRun.run_id)
+)
+_RUN_EXISTS_STATEMENT = lambda_stmt(
+    lambda: select(SimulationRun.run_id).where(SimulationRun.run_id == bindparam("run_id"))
+)
+_TRANSCRIPT_PAGE_STATEMENT = lambda_stmt(
+    lambda: select(TranscriptEventModel)
+    .where(TranscriptEventModel.run_id == bindparam("run_id"))
+    .where(TranscriptEventModel.id > bindparam("since_event_id"))
+    .order_by(TranscriptEventModel.id)
+    .limit(bindparam("limit"))
+)
 
 
 @dataclass(frozen=True)
@@ -43,9 +67,13 @@ class SimulationRunDTO:
     evaluation: Optional[EvaluationReport]
 
     def to_simulation_state(self) -> SimulationState:
-        """Project the run into a SimulationState."""
+        """Project the run into a SimulationState.
 
-        return SimulationState(
+        The DTO already holds model instances built by :func:`get_run`, validated or trusted per
+        its ``trusted`` flag, so the projection does not validate them again.
+        """
+
+        return SimulationState.model_construct(
             run_id=self.run_id,
             scenario=self.scenario,
             personas=self.personas,
@@ -55,13 +83,45 @@ class SimulationRunDTO:
         )
 
 
-def _serialize_personas(personas: List[PersonaSpec]) -> str:
-    personas_json = _PERSONA_LIST_ADAPTER.dump_json(personas)
-    return personas_json.decode() if isinstance(personas_json, bytes) else personas_json
+def _serialize_personas(personas: List[PersonaSpec]) -> List[dict[str, Any]]:
+    serialized: List[dict[str, Any]] = _PERSONA_LIST_ADAPTER.dump_python(
+        personas, mode="json", exclude_defaults=True, exclude_none=True
+    )
+    return serialized
+
+
+def _serialize_scenario(scenario: ScenarioSpec) -> dict[str, Any]:
+    return scenario.model_dump(mode="json", exclude_defaults=True, exclude_none=True)
+
+
+def _serialize_evaluation(report: EvaluationReport) -> dict[str, Any]:
+    return report.model_dump(mode="json", exclude_defaults=True, exclude_none=True)
 
 
-def _deserialize_personas(personas_json: str) -> List[PersonaSpec]:
-    return _PERSONA_LIST_ADAPTER.validate_json(personas_json)
+def _deserialize_personas(personas_json: List[dict[str, Any]]) -> List[PersonaSpec]:
+    return _PERSONA_LIST_ADAPTER.validate_python(personas_json)
+
+
+def _to_transcript_event(record: TranscriptEventModel, *, trusted: bool = False) -> TranscriptEvent:
+    data = {
+        "timestamp": record.timestamp,
+        "actor": record.actor,
+        "event_type": record.event_type,
+        "content": record.content,
+        "meta": orjson.loads(record.meta_json) if record.meta_json else None,
+    }
+    return TranscriptEvent.from_trusted(data) if trusted else TranscriptEvent(**data)
+
+
+def _event_row(run_id: UUID, event: TranscriptEvent) -> dict[str, Any]:
+    return {
+        "run_id": run_id,
+        "timestamp": event.timestamp,
+        "actor": event.actor,
+        "event_type": event.event_type.value,
+        "content": event.content,
+        "meta_json": orjson.dumps(event.meta).decode() if event.meta is not None else None,
+    }
 
 
 async def create_run(
@@ -78,8 +138,8 @@ async def create_run(
     """Create a new simulation run."""
 
     record = SimulationRun(
-        run_id=str(run_id),
-        scenario_json=scenario.model_dump_json(),
+        run_id=run_id,
+        scenario_json=_serialize_scenario(scenario),
         personas_json=_serialize_personas(personas),
         mode=mode,
         status=status,
@@ -100,82 +160,157 @@ async def create_run(
 async def add_event(session: AsyncSession, *, run_id: UUID, event: TranscriptEvent) -> None:
     """Persist a transcript event for a given run."""
 
-    record = TranscriptEventModel(
-        run_id=str(run_id),
-        timestamp=event.timestamp,
-        actor=event.actor,
-        event_type=event.event_type.value,
-        content=event.content,
-        meta_json=json.dumps(event.meta) if event.meta is not None else None,
-    )
-    session.add(record)
+    session.add(TranscriptEventModel(**_event_row(run_id, event)))
     await session.commit()
+    invalidate_run(run_id)
 
 
-async def set_status(session: AsyncSession, *, run_id: UUID, status: SimulationStatus) -> None:
-    """Update the status of a simulation run."""
+async def add_events_bulk(
+    session: AsyncSession, *, run_id: UUID, events: Sequence[TranscriptEvent]
+) -> None:
+    """Insert transcript events in a single statement, leaving the commit to the caller."""
 
-    query = (
-        update(SimulationRun)
-        .where(SimulationRun.run_id == str(run_id))
-        .values(status=status)
-        .execution_options(synchronize_session="fetch")
+    if not events:
+        return
+    await session.execute(
+        insert(TranscriptEventModel), [_event_row(run_id, event) for event in events]
+    )
+    invalidate_run(run_id)
+
+
+class TranscriptBuffer:
+    """Accumulate transcript events and insert them in batches.
+
+    Pending events are inserted every ``batch_size`` additions and when the context exits
+    cleanly. The buffer never commits; the surrounding unit of work owns the transaction.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        run_id: UUID,
+        batch_size: int = _TRANSCRIPT_BATCH_SIZE,
+    ) -> None:
+        self._session = session
+        self._run_id = run_id
+        self._batch_size = batch_size
+        self._pending: List[TranscriptEvent] = []
+
+    async def __aenter__(self) -> TranscriptBuffer:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.flush()
+
+    async def add(self, event: TranscriptEvent) -> None:
+        """Queue an event, inserting the pending batch once it is full."""
+
+        self._pending.append(event)
+        if len(self._pending) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Insert all pending events."""
+
+        pending, self._pending = self._pending, []
+        await add_events_bulk(self._session, run_id=self._run_id, events=pending)
+
+
+async def stage_status(
+    session: AsyncSession, *, run_id: UUID, status: SimulationStatus
+) -> None:
+    """Update the status of a simulation run without committing."""
+
+    result = await session.execute(
+        _SET_STATUS_STATEMENT,
+        {"target_run_id": run_id, "new_status": status},
+        execution_options={"synchronize_session": False},
     )
-    result = await session.execute(query)
-    if result.rowcount == 0:
+    if result.scalar_one_or_none() is None:
         msg = f"Simulation run {run_id} not found"
         raise LookupError(msg)
+
+
+async def set_status(session: AsyncSession, *, run_id: UUID, status: SimulationStatus) -> None:
+    """Update the status of a simulation run."""
+
+    await stage_status(session, run_id=run_id, status=status)
     await session.commit()
+    invalidate_run(run_id)
 
 
-async def save_evaluation(
+async def stage_evaluation(
     session: AsyncSession, *, run_id: UUID, report: EvaluationReport
 ) -> None:
-    """Save or replace the evaluation report for a run."""
+    """Save or replace the evaluation report for a run without committing."""
 
-    existing = await session.get(EvaluationReportModel, str(run_id))
+    existing = await session.get(EvaluationReportModel, run_id)
     if existing:
-        existing.report_json = report.model_dump_json()
+        existing.report_json = _serialize_evaluation(report)
     else:
         session.add(
-            EvaluationReportModel(run_id=str(run_id), report_json=report.model_dump_json())
+            EvaluationReportModel(run_id=run_id, report_json=_serialize_evaluation(report))
         )
+
+
+async def save_evaluation(
+    session: AsyncSession, *, run_id: UUID, report: EvaluationReport
+) -> None:
+    """Save or replace the evaluation report for a run."""
+
+    await stage_evaluation(session, run_id=run_id, report=report)
     await session.commit()
+    invalidate_run(run_id)
+
 
+async def get_run(
+    session: AsyncSession, run_id: UUID, *, trusted: bool = False
+) -> Optional[SimulationRunDTO]:
+    """Fetch a run along with transcript events and evaluation output.
 
-async def get_run(session: AsyncSession, run_id: UUID) -> Optional[SimulationRunDTO]:
-    """Fetch a run along with transcript events and evaluation output."""
+    Payloads were validated before they were written, so ``trusted`` rebuilds them with
+    ``model_construct`` instead of re-running validation.
+    """
 
-    run_record = await session.get(SimulationRun, str(run_id))
+    query = (
+        select(SimulationRun)
+        .options(
+            selectinload(SimulationRun.transcript_events),
+            selectinload(SimulationRun.evaluation_report),
+        )
+        .where(SimulationRun.run_id == run_id)
+        .execution_options(populate_existing=True)
+    )
+    run_record = (await session.execute(query)).scalar_one_or_none()
     if not run_record:
         return None
 
-    transcript_result = await session.execute(
-        select(TranscriptEventModel)
-        .where(TranscriptEventModel.run_id == run_record.run_id)
-        .order_by(TranscriptEventModel.id)
-    )
     transcript = [
-        TranscriptEvent(
-            timestamp=event.timestamp,
-            actor=event.actor,
-            event_type=event.event_type,
-            content=event.content,
-            meta=json.loads(event.meta_json) if event.meta_json else None,
-        )
-        for event in transcript_result.scalars().all()
+        _to_transcript_event(event, trusted=trusted) for event in run_record.transcript_events
     ]
 
-    report_record = await session.get(EvaluationReportModel, run_record.run_id)
-    evaluation = (
-        EvaluationReport.model_validate_json(report_record.report_json) if report_record else None
-    )
-
-    scenario = ScenarioSpec.model_validate_json(run_record.scenario_json)
-    personas = _deserialize_personas(run_record.personas_json)
+    report_record = run_record.evaluation_report
+    evaluation: Optional[EvaluationReport] = None
+    if trusted:
+        scenario = ScenarioSpec.from_trusted(run_record.scenario_json)
+        personas = [PersonaSpec.from_trusted(persona) for persona in run_record.personas_json]
+        if report_record:
+            evaluation = EvaluationReport.from_trusted(report_record.report_json)
+    else:
+        scenario = ScenarioSpec.model_validate(run_record.scenario_json)
+        personas = _deserialize_personas(run_record.personas_json)
+        if report_record:
+            evaluation = EvaluationReport.model_validate(report_record.report_json)
 
     return SimulationRunDTO(
-        run_id=UUID(run_record.run_id),
+        run_id=run_record.run_id,
         created_at=run_record.created_at,
         scenario=scenario,
         personas=personas,
@@ -186,3 +321,27 @@ async def get_run(session: AsyncSession, run_id: UUID) -> Optional[SimulationRun
         transcript=transcript,
         evaluation=evaluation,
     )
+
+
+async def get_transcript_page(
+    session: AsyncSession,
+    run_id: UUID,
+    *,
+    since_event_id: Optional[int] = None,
+    limit: int = _TRANSCRIPT_PAGE_SIZE,
+) -> Optional[TranscriptPage]:
+    """Fetch transcript events recorded after ``since_event_id`` without loading the run."""
+
+    run_exists = await session.scalar(_RUN_EXISTS_STATEMENT, {"run_id": run_id})
+    if run_exists is None:
+        return None
+
+    # Event ids are autoincrementing from 1, so a missing cursor is equivalent to zero.
+    params = {"run_id": run_id, "since_event_id": since_event_id or 0, "limit": limit}
+    records = (await session.execute(_TRANSCRIPT_PAGE_STATEMENT, params)).scalars().all()
+
+    return TranscriptPage(
+        run_id=run_id,
+        events=[_to_transcript_event(record) for record in records],
+        last_event_id=records[-1].id if records else since_event_id,
+    )
@@ -0,0 +1,42 @@
+"""In-process TTL cache for simulation runs that reached a terminal status."""
+
+from __future__ import annotations
+
+from typing import Final
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from persona_sim.schemas.sim_state import SimulationState
+
+_RUN_CACHE_MAXSIZE: Final = 1024
+_RUN_CACHE_TTL_SECONDS: Final = 120
+
+# Cache operations never await, so they are atomic on the event loop without a lock.
+_run_cache: TTLCache[str, SimulationState] = TTLCache(
+    maxsize=_RUN_CACHE_MAXSIZE, ttl=_RUN_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_run(run_id: UUID) -> SimulationState | None:
+    """Return the cached state for a run, if present and not expired."""
+
+    return _run_cache.get(str(run_id))
+
+
+def cache_run(run_id: UUID, state: SimulationState) -> None:
+    """Store the state of a finished run."""
+
+    _run_cache[str(run_id)] = state
+
+
+def invalidate_run(run_id: UUID) -> None:
+    """Drop any cached state for a run after it has been written to."""
+
+    _run_cache.pop(str(run_id), None)
+
+
+def clear_run_cache() -> None:
+    """Remove every cached run."""
+
+    _run_cache.clear()
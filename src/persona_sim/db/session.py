@@ -1,30 +1,147 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from persona_sim.core.config import get_settings
+from persona_sim.core.config import Settings, get_settings
 
+_PSYCOPG_PREPARE_THRESHOLD = 5
+_ASYNCPG_STATEMENT_CACHE_SIZE = 1024
+_QUERY_CACHE_SIZE = 1200
+_PING_STATEMENT = text("SELECT 1")
+# WAL lets pooled readers proceed during a write; NORMAL sync is durable under WAL, and a larger
+# page cache (negative values are KiB) keeps hot pages resident in each long-lived connection.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",
+)
+
+
+def _is_in_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _pool_options(
+    database_url: str,
+    *,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle_seconds: int,
+    pool_timeout_seconds: float,
+) -> dict[str, Any]:
+    """Return queue pool sizing for the configured database.
+
+    Connections are checked out LIFO so idle extras age out and hot connections stay warm. A
+    checkout that waits longer than ``pool_timeout_seconds`` fails fast instead of queueing.
+    In-memory SQLite relies on SQLAlchemy's single-connection default pool, so sizing is skipped.
+    """
+
+    if _is_in_memory_sqlite(database_url):
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": pool_recycle_seconds,
+        "pool_timeout": pool_timeout_seconds,
+        "pool_use_lifo": True,
+    }
+
+
+def _connect_args(database_url: str) -> dict[str, Any]:
+    """Driver-specific connection arguments.
+
+    psycopg 3 prepares a statement server-side once it has run ``prepare_threshold`` times;
+    asyncpg keeps up to ``statement_cache_size`` prepared statements per connection.
+    """
+
+    driver = make_url(database_url).get_driver_name()
+    if driver == "psycopg":
+        return {"prepare_threshold": _PSYCOPG_PREPARE_THRESHOLD}
+    if driver == "asyncpg":
+        return {"statement_cache_size": _ASYNCPG_STATEMENT_CACHE_SIZE}
+    return {}
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
-@lru_cache
-def get_engine() -> AsyncEngine:
-    """Create a configured async engine."""
 
-    settings = get_settings()
-    return create_async_engine(settings.database_url, echo=False, future=True)
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
 
 
-@lru_cache
-def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
-    """Return a shared async session factory."""
+@lru_cache(maxsize=4)
+def _create_engine(
+    database_url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle_seconds: int,
+    pool_timeout_seconds: float,
+) -> AsyncEngine:
+    engine = create_async_engine(
+        database_url,
+        echo=False,
+        future=True,
+        query_cache_size=_QUERY_CACHE_SIZE,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        connect_args=_connect_args(database_url),
+        **_pool_options(
+            database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle_seconds=pool_recycle_seconds,
+            pool_timeout_seconds=pool_timeout_seconds,
+        ),
+    )
+    backend = make_url(database_url).get_backend_name()
+    if backend == "sqlite" and not _is_in_memory_sqlite(database_url):
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
 
-    return async_sessionmaker(bind=get_engine(), expire_on_commit=False, autoflush=False)
+
+def get_engine(settings: Settings | None = None) -> AsyncEngine:
+    """Return the async engine for the given settings, shared per database configuration."""
+
+    active_settings = settings or get_settings()
+    return _create_engine(
+        active_settings.database_url,
+        active_settings.db_pool_size,
+        active_settings.db_max_overflow,
+        active_settings.db_pool_recycle_seconds,
+        active_settings.db_pool_timeout_seconds,
+    )
+
+
+@lru_cache(maxsize=4)
+def _create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+
+def get_sessionmaker(settings: Settings | None = None) -> async_sessionmaker[AsyncSession]:
+    """Return the session factory bound to the engine for the given settings."""
+
+    return _create_sessionmaker(get_engine(settings))
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -40,4 +157,20 @@ async def verify_database_connection(engine: AsyncEngine | None = None) -> None:
 
     active_engine = engine or get_engine()
     async with active_engine.connect() as connection:
-        await connection.execute(text("SELECT 1"))
+        await connection.execute(_PING_STATEMENT)
+
+
+async def warm_connection_pool(engine: AsyncEngine | None = None) -> int:
+    """Open and release ``pool_size`` connections so early requests skip connection setup.
+
+    Returns the number of connections that were pre-opened.
+    """
+
+    active_engine = engine or get_engine()
+    pool = active_engine.sync_engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return 0
+
+    connections = await asyncio.gather(*(active_engine.connect() for _ in range(pool.size())))
+    await asyncio.gather(*(connection.close() for connection in connections))
+    return len(connections)
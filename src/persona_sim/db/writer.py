@@ -0,0 +1,154 @@
+"""Background writer for persistence that callers do not need to wait on."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final
+from uuid import UUID
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from persona_sim.db.models import SimulationStatus
+from persona_sim.db.repositories import stage_evaluation, stage_status
+from persona_sim.db.run_cache import invalidate_run
+from persona_sim.db.session import get_sessionmaker
+from persona_sim.schemas.eval import EvaluationReport
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_BATCH_SIZE: Final = 32
+_DEFAULT_QUEUE_SIZE: Final = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class StatusWrite:
+    """Pending status transition for a run."""
+
+    run_id: UUID
+    status: SimulationStatus
+
+
+@dataclass(frozen=True, slots=True)
+class EvaluationWrite:
+    """Pending evaluation report for a run."""
+
+    run_id: UUID
+    report: EvaluationReport
+
+
+PendingWrite = StatusWrite | EvaluationWrite
+
+
+class BackgroundWriter:
+    """Apply queued writes in batches, one transaction per batch.
+
+    If a batch fails, its writes are retried one transaction each so a single bad write cannot
+    discard the others. The queue is bounded: once full, enqueueing raises ``asyncio.QueueFull``
+    so callers can write inline instead of growing memory behind a stalled database.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        max_queue_size: int = _DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._max_queue_size = max_queue_size
+        self._queue: asyncio.Queue[PendingWrite] | None = None
+        self._consumer: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the consumer task is accepting writes."""
+
+        return self._consumer is not None and not self._consumer.done()
+
+    def start(self) -> None:
+        """Start the consumer task on the running event loop."""
+
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._consumer = asyncio.create_task(self._consume(self._queue))
+
+    async def stop(self) -> None:
+        """Drain pending writes, then stop the consumer task."""
+
+        if self._queue is None or self._consumer is None:
+            return
+        await self._queue.join()
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+        self._queue = None
+        self._consumer = None
+
+    def enqueue(self, write: PendingWrite) -> None:
+        """Queue a write without waiting for it to be applied.
+
+        Raises ``asyncio.QueueFull`` when the queue is at capacity.
+        """
+
+        if self._queue is None or not self.running:
+            raise RuntimeError("BackgroundWriter is not running")
+        self._queue.put_nowait(write)
+
+    async def _consume(self, queue: asyncio.Queue[PendingWrite]) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._apply(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _apply(self, writes: list[PendingWrite]) -> None:
+        errors: list[Exception | None]
+        try:
+            await self._commit(writes)
+            errors = [None] * len(writes)
+        except Exception as exc:
+            errors = [exc] if len(writes) == 1 else [await self._commit_one(w) for w in writes]
+
+        for write, error in zip(writes, errors, strict=True):
+            invalidate_run(write.run_id)
+            if error is not None:
+                logger.warning(
+                    "background_write_failed", run_id=str(write.run_id), error=str(error)
+                )
+
+    async def _commit(self, writes: list[PendingWrite]) -> None:
+        async with self._session_factory() as session, session.begin():
+            for write in writes:
+                await _stage(session, write)
+
+    async def _commit_one(self, write: PendingWrite) -> Exception | None:
+        try:
+            await self._commit([write])
+        except Exception as exc:
+            return exc
+        return None
+
+
+async def _stage(session: AsyncSession, write: PendingWrite) -> None:
+    if isinstance(write, StatusWrite):
+        await stage_status(session, run_id=write.run_id, status=write.status)
+    else:
+        await stage_evaluation(session, run_id=write.run_id, report=write.report)
+
+
+@lru_cache
+def get_background_writer() -> BackgroundWriter:
+    """Return the process-wide writer bound to the default session factory."""
+
+    return BackgroundWriter(get_sessionmaker())
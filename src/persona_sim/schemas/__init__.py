@@ -4,10 +4,10 @@ from persona_sim.schemas.eval import EvaluationReport, Objection
 from persona_sim.schemas.persona_response import PersonaResponse
 from persona_sim.schemas.persona import AuthorityLevel, PersonaConstraints, PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
-from persona_sim.schemas.sim_state import PersonaState, SimulationState, TrustState
+from persona_sim.schemas.sim_state import PersonaState, SimulationState, TrustState, persona_key
 from persona_sim.schemas.stimulus import Stimulus, StimulusType
 from persona_sim.schemas.system import HealthResponse
-from persona_sim.schemas.transcript import TranscriptEvent, TranscriptEventType
+from persona_sim.schemas.transcript import TranscriptEvent, TranscriptEventType, TranscriptPage
 
 __all__ = [
     "AuthorityLevel",
@@ -23,6 +23,8 @@ __all__ = [
     "StimulusType",
     "TranscriptEvent",
     "TranscriptEventType",
+    "TranscriptPage",
     "TrustState",
     "HealthResponse",
+    "persona_key",
 ]
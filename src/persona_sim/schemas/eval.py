@@ -1,9 +1,10 @@
 """Evaluation schemas capturing persona responses and objections."""
 
+from collections.abc import Mapping
 from enum import Enum
-from typing import List
+from typing import Annotated, Any, List, Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 
 class ObjectionCategory(str, Enum):
@@ -26,14 +27,36 @@ class ObjectionSeverity(str, Enum):
     HIGH = "high"
 
 
+# Model fields use these Literal aliases, which pydantic-core validates without an Enum lookup.
+# The Enums above remain public and compare equal to the stored strings.
+Category = Literal["risk", "cost", "time", "trust", "compliance", "usability", "other"]
+Severity = Literal["low", "medium", "high"]
+
+
+def enum_member_value(value: Any) -> Any:
+    """Unwrap an Enum member to its value so Literal fields accept the public Enums too."""
+
+    return value.value if isinstance(value, Enum) else value
+
+
 class Objection(BaseModel):
     """Objection raised by a persona during evaluation."""
 
     model_config = ConfigDict(extra="forbid")
 
-    category: ObjectionCategory = Field(..., description="Category of the objection.")
+    category: Annotated[Category, BeforeValidator(enum_member_value)] = Field(
+        ..., description="Category of the objection."
+    )
     detail: str = Field(..., description="Detailed description of the objection.")
-    severity: ObjectionSeverity = Field(..., description="Severity of the objection.")
+    severity: Annotated[Severity, BeforeValidator(enum_member_value)] = Field(
+        ..., description="Severity of the objection."
+    )
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        return cls.model_construct(**data)
 
 
 class WillDecision(str, Enum):
@@ -44,13 +67,20 @@ class WillDecision(str, Enum):
     RELUCTANT = "reluctant"
 
 
+Decision = Literal["yes", "no", "reluctant"]
+
+
 class EvaluationReport(BaseModel):
     """Evaluation results for a simulation run."""
 
     model_config = ConfigDict(extra="forbid")
 
-    will_buy: WillDecision = Field(..., description="Buying decision outcome.")
-    will_use_daily: WillDecision = Field(..., description="Daily usage intent outcome.")
+    will_buy: Annotated[Decision, BeforeValidator(enum_member_value)] = Field(
+        ..., description="Buying decision outcome."
+    )
+    will_use_daily: Annotated[Decision, BeforeValidator(enum_member_value)] = Field(
+        ..., description="Daily usage intent outcome."
+    )
     trust_delta: float = Field(
         ..., ge=-1.0, le=1.0, description="Change in trust score between -1 and 1."
     )
@@ -64,3 +94,17 @@ class EvaluationReport(BaseModel):
         default_factory=list, description="Recommended next steps post-evaluation."
     )
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        return cls.model_construct(
+            **{
+                **data,
+                "top_objections": [
+                    Objection.from_trusted(objection)
+                    for objection in data.get("top_objections", [])
+                ],
+            }
+        )
+
@@ -1,10 +1,12 @@
 """Persona-related Pydantic schemas."""
 
+from collections.abc import Mapping
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional, Self
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, with_config
+from typing_extensions import TypedDict
 
 
 class AuthorityLevel(str, Enum):
@@ -15,21 +17,23 @@ class AuthorityLevel(str, Enum):
     HIGH = "high"
 
 
-class PersonaConstraints(BaseModel):
-    """Constraints and preferences that shape persona behavior."""
+@with_config(ConfigDict(extra="forbid"))
+class PersonaConstraints(TypedDict):
+    """Constraints and preferences that shape persona behavior.
 
-    model_config = ConfigDict(extra="forbid")
+    Declared as a ``TypedDict`` so pydantic-core validates it inline within ``PersonaSpec``.
+    """
 
-    time_per_week_minutes: int = Field(
-        ..., ge=0, description="Available time commitment in minutes per week."
-    )
-    budget_gbp: int = Field(..., ge=0, description="Budget available in GBP.")
-    ai_trust_level: int = Field(
-        ..., ge=1, le=5, description="Persona's trust in AI on a 1-5 scale."
-    )
-    authority_level: AuthorityLevel = Field(
-        ..., description="Decision-making authority within their organization."
-    )
+    time_per_week_minutes: Annotated[
+        int, Field(ge=0, description="Available time commitment in minutes per week.")
+    ]
+    budget_gbp: Annotated[int, Field(ge=0, description="Budget available in GBP.")]
+    ai_trust_level: Annotated[
+        int, Field(ge=1, le=5, description="Persona's trust in AI on a 1-5 scale.")
+    ]
+    authority_level: Annotated[
+        AuthorityLevel, Field(description="Decision-making authority within their organization.")
+    ]
 
 
 class PersonaSpec(BaseModel):
@@ -37,6 +41,7 @@ class PersonaSpec(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        revalidate_instances="never",
         json_schema_extra={
             "example": {
                 "id": "2fdab821-76d6-4c04-9a4b-6bc0099ae0b0",
@@ -76,3 +81,21 @@ class PersonaSpec(BaseModel):
     communication_style: Optional[str] = Field(
         default=None, description="Preferred communication style for the persona."
     )
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        constraints = data["constraints"]
+        return cls.model_construct(
+            **{
+                **data,
+                "id": UUID(str(data["id"])),
+                "constraints": PersonaConstraints(
+                    time_per_week_minutes=constraints["time_per_week_minutes"],
+                    budget_gbp=constraints["budget_gbp"],
+                    ai_trust_level=constraints["ai_trust_level"],
+                    authority_level=AuthorityLevel(constraints["authority_level"]),
+                ),
+            }
+        )
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import re
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, field_validator
 
-from persona_sim.schemas.eval import Objection
+from persona_sim.schemas.eval import Objection, enum_member_value
+
+_MAX_SHORT_ANSWER_WORDS = 120
+# Words are separated by whitespace, so shorter strings cannot exceed the word limit.
+_MIN_CHARS_FOR_WORD_LIMIT = 2 * _MAX_SHORT_ANSWER_WORDS - 1
+_WORD_RE = re.compile(r"\S+")
 
 
 class PersonaResponseStance(str, Enum):
@@ -18,12 +24,17 @@ class PersonaResponseStance(str, Enum):
     RELUCTANT = "reluctant"
 
 
+Stance = Literal["yes", "no", "reluctant"]
+
+
 class PersonaResponse(BaseModel):
     """Structured representation of a persona's reply to a stimulus."""
 
     model_config = ConfigDict(extra="forbid")
 
-    stance: PersonaResponseStance = Field(..., description="Overall stance taken.")
+    stance: Annotated[Stance, BeforeValidator(enum_member_value)] = Field(
+        ..., description="Overall stance taken."
+    )
     top_concerns: List[str] = Field(
         ...,
         min_length=1,
@@ -48,8 +59,10 @@ class PersonaResponse(BaseModel):
     def _limit_short_answer_words(cls, value: str) -> str:  # noqa: D401 - simple validation
         """Ensure the short answer does not exceed 120 words."""
 
-        word_count = len(value.split())
-        if word_count > 120:
+        if len(value) < _MIN_CHARS_FOR_WORD_LIMIT:
+            return value
+        word_count = sum(1 for _ in _WORD_RE.finditer(value))
+        if word_count > _MAX_SHORT_ANSWER_WORDS:
             msg = f"short_answer must be 120 words or fewer (received {word_count})"
             raise ValueError(msg)
         return value
@@ -65,3 +78,7 @@ class PersonaResponse(BaseModel):
             msg = "clarifying_questions must contain at most 3 entries"
             raise ValueError(msg)
         return value
+
+
+# Built once at import so the persona node validates LLM output without per-call model lookups.
+PERSONA_RESPONSE_ADAPTER: TypeAdapter[PersonaResponse] = TypeAdapter(PersonaResponse)
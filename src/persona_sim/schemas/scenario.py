@@ -1,6 +1,7 @@
 """Scenario-related Pydantic schemas."""
 
-from typing import List, Optional
+from collections.abc import Mapping
+from typing import Any, List, Optional, Self
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -11,6 +12,7 @@ class ScenarioSpec(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        revalidate_instances="never",
         json_schema_extra={
             "example": {
                 "id": "b5e18cb6-2f20-4f6d-a061-c3f46a45c265",
@@ -35,3 +37,9 @@ class ScenarioSpec(BaseModel):
     success_criteria: List[str] = Field(
         default_factory=list, description="Success criteria defined for the scenario."
     )
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        return cls.model_construct(**{**data, "id": UUID(str(data["id"]))})
@@ -1,9 +1,15 @@
-"""Simulation state schemas for tracking run progress."""
+"""Simulation state schemas for tracking run progress.
 
-from typing import Dict, List, Optional
+These models are built by the service and graph or loaded from the database, never parsed from
+client input, so they ignore unknown keys instead of paying for an extra-key scan.
+"""
+
+from collections.abc import Mapping
+from typing import Annotated, Any, Dict, List, Optional, Self
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, with_config
+from typing_extensions import TypedDict
 
 from persona_sim.schemas.eval import EvaluationReport
 from persona_sim.schemas.persona import PersonaSpec
@@ -11,11 +17,8 @@ from persona_sim.schemas.scenario import ScenarioSpec
 from persona_sim.schemas.transcript import TranscriptEvent
 
 
-class TrustState(BaseModel):
-    """Trust and fatigue metrics for a persona."""
-
-    model_config = ConfigDict(
-        extra="forbid",
+@with_config(
+    ConfigDict(
         json_schema_extra={
             "example": {
                 "trust_score": 0.62,
@@ -24,21 +27,28 @@ class TrustState(BaseModel):
             }
         },
     )
+)
+class TrustState(TypedDict):
+    """Trust and fatigue metrics for a persona.
 
-    trust_score: float = Field(..., ge=0.0, le=1.0, description="Trust score in range 0-1.")
-    fatigue_score: float = Field(
-        ..., ge=0.0, le=1.0, description="Fatigue score in range 0-1 reflecting burnout."
-    )
-    risk_tolerance: float = Field(
-        ..., ge=0.0, le=1.0, description="Risk tolerance in range 0-1 reflecting risk appetite."
-    )
+    Declared as a ``TypedDict`` so pydantic-core validates it inline within ``PersonaState``.
+    """
+
+    trust_score: Annotated[float, Field(ge=0.0, le=1.0, description="Trust score in range 0-1.")]
+    fatigue_score: Annotated[
+        float, Field(ge=0.0, le=1.0, description="Fatigue score in range 0-1 reflecting burnout.")
+    ]
+    risk_tolerance: Annotated[
+        float,
+        Field(ge=0.0, le=1.0, description="Risk tolerance in range 0-1 reflecting risk appetite."),
+    ]
 
 
 class PersonaState(BaseModel):
     """State snapshot for an individual persona."""
 
     model_config = ConfigDict(
-        extra="forbid",
+        revalidate_instances="never",
         json_schema_extra={
             "example": {
                 "persona_id": "2fdab821-76d6-4c04-9a4b-6bc0099ae0b0",
@@ -70,12 +80,34 @@ class PersonaState(BaseModel):
         description="Boolean flags tracking persona-specific toggles or states.",
     )
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        return cls.model_construct(
+            **{
+                **data,
+                "persona_id": UUID(str(data["persona_id"])),
+                "trust_state": TrustState(
+                    trust_score=data["trust_state"]["trust_score"],
+                    fatigue_score=data["trust_state"]["fatigue_score"],
+                    risk_tolerance=data["trust_state"]["risk_tolerance"],
+                ),
+            }
+        )
+
+
+def persona_key(persona_id: UUID | str) -> str:
+    """Return the ``SimulationState.persona_states`` key for a persona identifier."""
+
+    return str(persona_id)
+
 
 class SimulationState(BaseModel):
     """Aggregate simulation state across personas and scenario."""
 
     model_config = ConfigDict(
-        extra="forbid",
+        revalidate_instances="never",
         json_schema_extra={
             "example": {
                 "run_id": "d07be1ed-958e-4b9e-81c9-eaaf995c6a60",
@@ -132,9 +164,9 @@ class SimulationState(BaseModel):
     personas: List[PersonaSpec] = Field(
         default_factory=list, description="Personas participating in the simulation."
     )
-    persona_states: Dict[UUID, PersonaState] = Field(
+    persona_states: Dict[str, PersonaState] = Field(
         default_factory=dict,
-        description="State keyed by persona identifier for quick access.",
+        description="State keyed by canonical persona identifier string for quick access.",
     )
     transcript: List[TranscriptEvent] = Field(
         default_factory=list, description="Chronological transcript of simulation events."
@@ -142,3 +174,22 @@ class SimulationState(BaseModel):
     outputs: Optional[EvaluationReport] = Field(
         default=None, description="Optional evaluation report produced post-simulation."
     )
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        outputs = data.get("outputs")
+        return cls.model_construct(
+            run_id=UUID(str(data["run_id"])),
+            scenario=ScenarioSpec.from_trusted(data["scenario"]),
+            personas=[PersonaSpec.from_trusted(persona) for persona in data.get("personas", [])],
+            persona_states={
+                persona_key(persona_id): PersonaState.from_trusted(state)
+                for persona_id, state in data.get("persona_states", {}).items()
+            },
+            transcript=[
+                TranscriptEvent.from_trusted(event) for event in data.get("transcript", [])
+            ],
+            outputs=EvaluationReport.from_trusted(outputs) if outputs is not None else None,
+        )
@@ -1,7 +1,13 @@
-"""Transcript event schemas for simulation logging."""
+"""Transcript event schemas for simulation logging.
 
+Events are produced by the graph and read back from storage rather than accepted from clients, so
+the models ignore unknown keys.
+"""
+
+from collections.abc import Mapping
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Self
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,7 +24,7 @@ class TranscriptEventType(str, Enum):
 class TranscriptEvent(BaseModel):
     """Event entry recorded during a simulation run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(revalidate_instances="never")
 
     timestamp: str = Field(..., description="Timestamp of the event in ISO format.")
     actor: str = Field(..., description='Actor generating the event, persona ID or "system".')
@@ -28,3 +34,23 @@ class TranscriptEvent(BaseModel):
         default=None, description="Optional metadata associated with the event."
     )
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build from previously validated JSON data without re-running validation."""
+
+        return cls.model_construct(
+            **{**data, "event_type": TranscriptEventType(data["event_type"])}
+        )
+
+
+class TranscriptPage(BaseModel):
+    """Slice of a run transcript returned to polling clients."""
+
+    run_id: UUID = Field(..., description="Identifier of the run the events belong to.")
+    events: List[TranscriptEvent] = Field(
+        default_factory=list, description="Events recorded after the requested cursor, in order."
+    )
+    last_event_id: Optional[int] = Field(
+        default=None,
+        description="Cursor to pass as since_event_id on the next poll; null if no events exist.",
+    )
@@ -14,13 +14,11 @@ from persona_sim.sim.graph.nodes import (
     persona_response_node,
     update_state_node,
 )
-from persona_sim.sim.graph.state import GraphState, RunMode
+from persona_sim.sim.graph.state import GraphState
 
 
 def _route_after_update(state: GraphState) -> str:
-    turn_count = len(state.config.turns) or 1
-    max_turns = 1 if state.config.mode == RunMode.SINGLE_TURN else turn_count
-    return "continue" if state.current_turn < max_turns else "evaluate"
+    return "continue" if state.current_turn < state.config.max_turns else "evaluate"
 
 
 def build_simulation_graph(deps: GraphDependencies) -> StateGraph:
@@ -3,30 +3,39 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from collections.abc import Awaitable, Callable, Iterable, Sequence
+import hashlib
+from collections.abc import Awaitable, Callable, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import Any, Literal
 from uuid import UUID
 
+import structlog
 from langchain_core.messages import BaseMessage
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from persona_sim.db.models import SimulationStatus
-from persona_sim.db.repositories import add_event, create_run, save_evaluation, set_status
+from persona_sim.db.repositories import (
+    add_events_bulk,
+    create_run,
+    save_evaluation,
+    set_status,
+)
 from persona_sim.schemas.eval import EvaluationReport, ObjectionSeverity, WillDecision
 from persona_sim.schemas.persona import PersonaSpec
+from persona_sim.schemas.persona_response import PERSONA_RESPONSE_ADAPTER
 from persona_sim.schemas.persona_response import PersonaResponse as PersonaResponsePayload
-from persona_sim.schemas.sim_state import PersonaState, SimulationState, TrustState
+from persona_sim.schemas.sim_state import PersonaState, SimulationState, TrustState, persona_key
 from persona_sim.schemas.transcript import TranscriptEvent, TranscriptEventType
 from persona_sim.sim.heuristics import (
     PersonaResponseObjection,
     PersonaResponseSummary,
     apply_persona_heuristics,
 )
-from persona_sim.sim.graph.state import GraphState, PersonaResponse, RunMode, TurnInput
+from persona_sim.sim.graph.state import GraphState, PersonaResponse, TurnInput
 from persona_sim.sim.llm.client import get_llm
-from persona_sim.sim.llm.structured import StructuredOutputError, invoke_structured
+from persona_sim.sim.llm.structured import ainvoke_structured, prompt_cache_key
 from persona_sim.sim.prompts.eval_prompts import build_evaluator_prompt
 from persona_sim.sim.prompts.persona_prompts import (
     build_persona_system_prompt,
@@ -37,10 +46,18 @@ PersonaResponder = Callable[
     [Sequence[BaseMessage], str, float], Awaitable[str | PersonaResponsePayload]
 ]
 EvaluationResponder = Callable[[Sequence[BaseMessage]], Awaitable[EvaluationReport]]
+# Why a persona reply could not be used; recorded on the answer event in place of the payload.
+_FallbackReason = Literal["empty", "invalid"]
+
+logger = structlog.get_logger(__name__)
 
 _DEFAULT_TRUST = 0.5
 _DEFAULT_FATIGUE = 0.0
 _DEFAULT_RISK_TOLERANCE = 0.5
+_DEFAULT_PERSONA_CONCURRENCY = 32
+_SEVERITIES_BY_RANK = (ObjectionSeverity.LOW, ObjectionSeverity.MEDIUM, ObjectionSeverity.HIGH)
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(_SEVERITIES_BY_RANK)}
+_FALLBACK_PERSONA_MODES = ("economic_buyer", "daily_user", "anti_persona")
 
 
 @dataclass(slots=True)
@@ -52,20 +69,29 @@ class GraphDependencies:
     evaluation_responder: EvaluationResponder = field(
         default_factory=lambda: _default_evaluation_responder
     )
+    persona_concurrency: int = _DEFAULT_PERSONA_CONCURRENCY
+    response_cache: MutableMapping[str, PersonaResponsePayload] | None = None
 
 
 async def _default_persona_responder(
     messages: Sequence[BaseMessage], model_name: str, temperature: float
 ) -> PersonaResponsePayload:
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        None, lambda: invoke_structured(messages, PersonaResponsePayload)
+    return await ainvoke_structured(
+        messages, PersonaResponsePayload, cache_key=_system_prompt_cache_key(messages)
     )
 
 
 async def _default_evaluation_responder(messages: Sequence[BaseMessage]) -> EvaluationReport:
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, lambda: invoke_structured(messages, EvaluationReport))
+    return await ainvoke_structured(
+        messages, EvaluationReport, cache_key=_system_prompt_cache_key(messages)
+    )
+
+
+def _system_prompt_cache_key(messages: Sequence[BaseMessage]) -> str | None:
+    # The leading system prompt is the stable prefix shared across turns and runs.
+    if messages and messages[0].type == "system":
+        return prompt_cache_key(str(messages[0].content))
+    return None
 
 
 def _timestamp() -> str:
@@ -73,65 +99,64 @@ def _timestamp() -> str:
 
 
 def _highest_severity(summary: PersonaResponseSummary) -> ObjectionSeverity:
-    if any(obj.severity == ObjectionSeverity.HIGH for obj in summary.objections):
-        return ObjectionSeverity.HIGH
-    if any(obj.severity == ObjectionSeverity.MEDIUM for obj in summary.objections):
-        return ObjectionSeverity.MEDIUM
-    return ObjectionSeverity.LOW
+    rank = max((_SEVERITY_RANK[obj.severity] for obj in summary.objections), default=0)
+    return _SEVERITIES_BY_RANK[rank]
+
+
+def _fallback_persona_response() -> PersonaResponsePayload:
+    # Deliberately not a valid PersonaResponse (top_concerns is empty); it only carries the neutral
+    # stance through the summary. Events built from it are tagged and skip the trust update.
+    return PersonaResponsePayload.model_construct(
+        stance=WillDecision.RELUCTANT.value,
+        top_concerns=[],
+        objections=[],
+        required_proof=[],
+        short_answer="",
+        clarifying_questions=None,
+    )
 
 
 def _parse_persona_response(
-    raw_response: str | PersonaResponsePayload, prompt_messages: Sequence[BaseMessage]
-) -> PersonaResponsePayload:
+    raw_response: str | PersonaResponsePayload, persona: PersonaSpec
+) -> PersonaResponsePayload | _FallbackReason:
+    # Retries belong to the responder (ainvoke_structured bounds them), so an unusable reply is
+    # reported by reason instead of being paid for with another LLM call.
     if isinstance(raw_response, PersonaResponsePayload):
         return raw_response
 
     content = str(raw_response)
-    stripped = content.strip()
-    if not stripped:
-        return invoke_structured(prompt_messages, PersonaResponsePayload)
+    if not content.strip():
+        logger.warning("persona_response_empty", persona_id=str(persona.id))
+        return "empty"
 
     try:
-        return PersonaResponsePayload.model_validate_json(content)
-    except Exception:
-        pass
-
-    if stripped.startswith("{") or stripped.startswith("["):
-        try:
-            parsed = json.loads(content)
-            return PersonaResponsePayload.model_validate(parsed)
-        except Exception:
-            try:
-                return invoke_structured(prompt_messages, PersonaResponsePayload)
-            except StructuredOutputError:
-                pass
-
-    return invoke_structured(prompt_messages, PersonaResponsePayload)
+        return PERSONA_RESPONSE_ADAPTER.validate_json(content)
+    except ValidationError as exc:
+        logger.warning("persona_response_invalid", persona_id=str(persona.id), error=str(exc))
+        return "invalid"
 
 
 def _to_summary_from_payload(payload: PersonaResponsePayload) -> PersonaResponseSummary:
     objections = [
-        PersonaResponseObjection(detail=obj.detail, severity=obj.severity)
+        PersonaResponseObjection(detail=obj.detail, severity=ObjectionSeverity(obj.severity))
         for obj in payload.objections
     ]
-    stance = WillDecision(payload.stance.value)
+    stance = WillDecision(payload.stance)
     return PersonaResponseSummary(message=payload.short_answer, stance=stance, objections=objections)
 
 
-def _resolve_persona_mode(
-    persona_id: UUID, personas: list[PersonaSpec], mode_map: dict[UUID, str]
-) -> str:
-    if persona_id in mode_map:
-        return mode_map[persona_id]
-
-    fallback_modes = ("economic_buyer", "daily_user", "anti_persona")
-    index = next((idx for idx, persona in enumerate(personas) if persona.id == persona_id), 0)
-    return fallback_modes[index % len(fallback_modes)]
+def _resolve_persona_modes(
+    personas: Sequence[PersonaSpec], mode_map: dict[UUID, str]
+) -> list[str]:
+    return [
+        mode_map.get(persona.id) or _FALLBACK_PERSONA_MODES[index % len(_FALLBACK_PERSONA_MODES)]
+        for index, persona in enumerate(personas)
+    ]
 
 
-def _initialize_persona_state(persona: PersonaSpec) -> PersonaState:
+def _initialize_persona_state(persona_id: UUID) -> PersonaState:
     return PersonaState(
-        persona_id=persona.id,
+        persona_id=persona_id,
         trust_state=TrustState(
             trust_score=_DEFAULT_TRUST,
             fatigue_score=_DEFAULT_FATIGUE,
@@ -140,10 +165,12 @@ def _initialize_persona_state(persona: PersonaSpec) -> PersonaState:
     )
 
 
-def _merge_persona_states(state: GraphState) -> dict[UUID, PersonaState]:
+def _merge_persona_states(state: GraphState) -> dict[str, PersonaState]:
     merged = dict(state.simulation.persona_states)
     for persona in state.simulation.personas:
-        merged.setdefault(persona.id, _initialize_persona_state(persona))
+        key = persona_key(persona.id)
+        if key not in merged:
+            merged[key] = _initialize_persona_state(persona.id)
     return merged
 
 
@@ -155,19 +182,19 @@ def _attach_event(
     content: str,
     meta: dict | None = None,
     step: int | None = None,
-) -> SimulationState:
+) -> None:
     merged_meta = dict(meta or {})
     if step is not None:
         merged_meta.setdefault("step", step)
-    event = TranscriptEvent(
+    # Node-built events come from validated state, so the free-form meta is not re-walked.
+    event = TranscriptEvent.model_construct(
         timestamp=_timestamp(),
         actor=actor,
         event_type=event_type,
         content=content,
         meta=merged_meta or None,
     )
-    transcript = [*simulation.transcript, event]
-    return simulation.model_copy(update={"transcript": transcript})
+    simulation.transcript.append(event)
 
 
 def _question_content(turn_question: str | None, stimulus_summary: str) -> str:
@@ -189,28 +216,40 @@ def _event_for_response(
     payload: PersonaResponsePayload,
     summary: PersonaResponseSummary,
     *,
+    severity: ObjectionSeverity,
     step: int,
+    fallback_reason: _FallbackReason | None = None,
 ) -> TranscriptEvent:
-    severity = _highest_severity(summary)
-    return TranscriptEvent(
+    # payload was validated when the LLM output was parsed; nothing here needs re-checking. The
+    # meta stays plain JSON data and is encoded once, when the event row is written.
+    meta: dict[str, Any] = {
+        "step": step,
+        "stance": summary.stance.value,
+        "severity": severity.value,
+    }
+    if fallback_reason is None:
+        meta["raw"] = payload.model_dump(mode="json")
+    else:
+        meta["fallback"] = True
+        meta["reason"] = fallback_reason
+    return TranscriptEvent.model_construct(
         timestamp=_timestamp(),
         actor=persona.name,
         event_type=TranscriptEventType.ANSWER,
         content=summary.message,
-        meta={
-            "step": step,
-            "stance": summary.stance.value,
-            "severity": severity.value,
-            "raw": payload.model_dump(),
-        },
+        meta=meta,
     )
 
 
 async def init_run_node(state: GraphState, deps: GraphDependencies) -> GraphState:
-    simulation = state.simulation
-    merged_persona_states = _merge_persona_states(state)
-    simulation = simulation.model_copy(update={"persona_states": merged_persona_states})
-    simulation = _attach_event(
+    # Take one shallow copy with fresh containers; later nodes append to them in place.
+    simulation = state.simulation.model_copy(
+        update={
+            "persona_states": _merge_persona_states(state),
+            "transcript": list(state.simulation.transcript),
+        }
+    )
+    _attach_event(
         simulation,
         actor="system",
         event_type=TranscriptEventType.SYSTEM,
@@ -229,13 +268,88 @@ async def init_run_node(state: GraphState, deps: GraphDependencies) -> GraphStat
             status=SimulationStatus.RUNNING,
         )
 
-    return state.model_copy(update={"simulation": simulation})
+    state.simulation = simulation
+    state.resolved_persona_modes = _resolve_persona_modes(
+        simulation.personas, state.config.persona_modes
+    )
+    return state
+
+
+def _response_cache_key(
+    prompt_messages: Sequence[BaseMessage], model_name: str, temperature: float
+) -> str:
+    digest = hashlib.blake2b(f"{model_name}|{temperature}".encode(), digest_size=32)
+    for message in prompt_messages:
+        digest.update(f"\x00{message.type}\x00".encode())
+        digest.update(str(message.content).encode())
+    return digest.hexdigest()
+
+
+async def _respond_as_persona(
+    persona: PersonaSpec,
+    persona_mode: str,
+    simulation: SimulationState,
+    state: GraphState,
+    turn_input: TurnInput,
+    deps: GraphDependencies,
+    semaphore: asyncio.Semaphore,
+) -> tuple[TranscriptEvent, PersonaResponse]:
+    prompt_key = (persona_key(persona.id), persona_mode)
+    system_prompt = state.system_prompts.get(prompt_key)
+    if system_prompt is None:
+        system_prompt = build_persona_system_prompt(persona, simulation.scenario, mode=persona_mode)
+        state.system_prompts[prompt_key] = system_prompt
+    user_prompt = build_persona_user_prompt(turn_input.stimulus, turn_input.question)
+    prompt_messages = [*system_prompt, *user_prompt]
+    response_cache = deps.response_cache
+    cache_key = None
+    payload = None
+    fallback_reason: _FallbackReason | None = None
+    if response_cache is not None:
+        cache_key = _response_cache_key(
+            prompt_messages, state.config.model_name, state.config.temperature
+        )
+        payload = response_cache.get(cache_key)
+    if payload is None:
+        async with semaphore:
+            raw_response = await deps.persona_responder(
+                prompt_messages,
+                state.config.model_name,
+                state.config.temperature,
+            )
+        parsed = _parse_persona_response(raw_response, persona)
+        if isinstance(parsed, str):
+            # Unusable replies get a neutral stance, are tagged as fallbacks, and are never cached.
+            fallback_reason = parsed
+            payload = _fallback_persona_response()
+        else:
+            payload = parsed
+            if response_cache is not None and cache_key is not None:
+                response_cache[cache_key] = payload
+    summary = _to_summary_from_payload(payload)
+    severity = _highest_severity(summary)
+    response_event = _event_for_response(
+        persona,
+        payload,
+        summary,
+        severity=severity,
+        step=state.current_turn + 1,
+        fallback_reason=fallback_reason,
+    )
+    persona_response = PersonaResponse(
+        persona_id=persona.id,
+        content=payload.short_answer,
+        persona_mode=persona_mode,
+        summary=summary,
+        stance=summary.stance,
+        objection_severity=severity,
+        is_fallback=fallback_reason is not None,
+    )
+    return response_event, persona_response
 
 
 async def persona_response_node(state: GraphState, deps: GraphDependencies) -> GraphState:
-    turn_count = len(state.config.turns) or 1
-    max_turns = 1 if state.config.mode is RunMode.SINGLE_TURN else turn_count
-    if state.current_turn >= max_turns:
+    if state.current_turn >= state.config.max_turns:
         return state
 
     turn_input = state.config.turns[state.current_turn] if state.config.turns else None
@@ -244,105 +358,114 @@ async def persona_response_node(state: GraphState, deps: GraphDependencies) -> G
 
     stimulus_text = _stimulus_summary(turn_input)
     question_event_content = _question_content(turn_input.question, stimulus_text)
-    simulation = _attach_event(
-        state.simulation,
+    simulation = state.simulation
+    _attach_event(
+        simulation,
         actor="system",
         event_type=TranscriptEventType.QUESTION,
         content=question_event_content,
         step=state.current_turn + 1,
     )
 
-    responses: list[TranscriptEvent] = []
-    persona_responses: list[PersonaResponse] = []
-    for persona in simulation.personas:
-        persona_mode = _resolve_persona_mode(
-            persona.id, simulation.personas, state.config.persona_modes
-        )
-        system_prompt = build_persona_system_prompt(persona, simulation.scenario, mode=persona_mode)
-        user_prompt = build_persona_user_prompt(turn_input.stimulus, turn_input.question)
-        prompt_messages = [*system_prompt, *user_prompt]
-        raw_response = await deps.persona_responder(
-            [*system_prompt, *user_prompt],
-            state.config.model_name,
-            state.config.temperature,
-        )
-        payload = _parse_persona_response(raw_response, prompt_messages)
-        summary = _to_summary_from_payload(payload)
-        response_event = _event_for_response(
-            persona, payload, summary, step=state.current_turn + 1
+    persona_modes = state.resolved_persona_modes
+    if len(persona_modes) != len(simulation.personas):
+        # Nodes invoked without init_run_node resolve modes here instead.
+        persona_modes = state.resolved_persona_modes = _resolve_persona_modes(
+            simulation.personas, state.config.persona_modes
         )
-        responses.append(response_event)
-        persona_responses.append(
-            PersonaResponse(
-                persona_id=persona.id,
-                content=payload.short_answer,
-                persona_mode=persona_mode,
-                summary=summary,
-                stance=summary.stance,
-                objection_severity=_highest_severity(summary),
-            )
-        )
-
-    updated_transcript = [*simulation.transcript, *responses]
-    simulation = simulation.model_copy(update={"transcript": updated_transcript})
 
-    return state.model_copy(
-        update={"simulation": simulation, "latest_responses": persona_responses}
+    # Persona turns are independent, so their LLM calls run concurrently; gather keeps order.
+    semaphore = asyncio.Semaphore(deps.persona_concurrency)
+    outcomes = await asyncio.gather(
+        *(
+            _respond_as_persona(persona, mode, simulation, state, turn_input, deps, semaphore)
+            for persona, mode in zip(simulation.personas, persona_modes, strict=True)
+        ),
+        return_exceptions=True,
     )
+    # Every call settles before a failure propagates, so no responder is left running unobserved.
+    results: list[tuple[TranscriptEvent, PersonaResponse]] = []
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+        results.append(outcome)
+
+    simulation.transcript.extend(response_event for response_event, _ in results)
+    state.latest_responses = [persona_response for _, persona_response in results]
+    return state
 
 
 async def update_state_node(state: GraphState) -> GraphState:
-    persona_states = _merge_persona_states(state)
-
+    # Models skip revalidation, so the state is updated in place instead of copied per turn.
+    simulation = state.simulation
+    persona_states = simulation.persona_states
     for response in state.latest_responses:
-        persona_state = persona_states.get(response.persona_id) or _initialize_persona_state(
-            next(p for p in state.simulation.personas if p.id == response.persona_id)
-        )
-        updated_trust_state = apply_persona_heuristics(
+        if response.is_fallback:
+            # No usable reply was received, so there is no signal to move trust or fatigue.
+            continue
+        key = persona_key(response.persona_id)
+        persona_state = persona_states.get(key)
+        if persona_state is None:
+            # init_run_node seeds every persona; this only covers states injected mid-run.
+            persona_state = persona_states[key] = _initialize_persona_state(response.persona_id)
+        persona_state.trust_state = apply_persona_heuristics(
             previous=persona_state.trust_state,
             response=response.summary,
             mode=response.persona_mode,
         )
 
-        persona_states[response.persona_id] = persona_state.model_copy(
-            update={"trust_state": updated_trust_state}
-        )
+    state.current_turn += 1
+    return state
 
-    next_turn = state.current_turn + 1
-    simulation = state.simulation.model_copy(update={"persona_states": persona_states})
-    return state.model_copy(update={"simulation": simulation, "current_turn": next_turn})
+
+async def _persist_events(
+    session_factory: async_sessionmaker[AsyncSession],
+    run_id: UUID,
+    events: list[TranscriptEvent],
+) -> int:
+    async with session_factory() as session:
+        await add_events_bulk(session, run_id=run_id, events=events)
+        await session.commit()
+    return len(events)
 
 
 async def evaluator_node(state: GraphState, deps: GraphDependencies) -> GraphState:
     simulation = state.simulation
     prompt = build_evaluator_prompt(simulation.transcript, simulation.personas, simulation.scenario)
-    report = await deps.evaluation_responder(prompt)
+    # The transcript so far is final, so it is written while the evaluator call is in flight.
+    state.pending_persist = asyncio.create_task(
+        _persist_events(deps.session_factory, simulation.run_id, list(simulation.transcript))
+    )
+    try:
+        report = await deps.evaluation_responder(prompt)
+    except BaseException:
+        await asyncio.gather(state.pending_persist, return_exceptions=True)
+        raise
 
-    evaluation_event = TranscriptEvent(
+    # The evaluation responder returns a validated EvaluationReport, so its dump is trusted.
+    evaluation_event = TranscriptEvent.model_construct(
         timestamp=_timestamp(),
         actor="system",
         event_type=TranscriptEventType.EVALUATION,
         content="Evaluation completed",
-        meta=report.model_dump(),
+        meta=report.model_dump(mode="json"),
     )
-    transcript = [*simulation.transcript, evaluation_event]
-    simulation = simulation.model_copy(update={"outputs": report, "transcript": transcript})
-    return state.model_copy(update={"simulation": simulation})
+    simulation.transcript.append(evaluation_event)
+    simulation.outputs = report
+    return state
 
 
 async def persist_node(state: GraphState, deps: GraphDependencies) -> GraphState:
     simulation = state.simulation
+    persisted = await state.pending_persist if state.pending_persist is not None else 0
     async with deps.session_factory() as session:
-        await _persist_transcript(session, simulation.run_id, simulation.transcript)
+        # Events not written during evaluation are committed with the evaluation and final status.
+        await add_events_bulk(
+            session, run_id=simulation.run_id, events=simulation.transcript[persisted:]
+        )
         if simulation.outputs:
             await save_evaluation(session, run_id=simulation.run_id, report=simulation.outputs)
         await set_status(session, run_id=simulation.run_id, status=SimulationStatus.COMPLETED)
 
     return state
 
-
-async def _persist_transcript(
-    session: AsyncSession, run_id: UUID, transcript: Iterable[TranscriptEvent]
-) -> None:
-    for event in transcript:
-        await add_event(session, run_id=run_id, event=event)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel, Field
 
 from persona_sim.schemas.eval import ObjectionSeverity, WillDecision
 from persona_sim.schemas.sim_state import SimulationState
@@ -21,41 +24,44 @@ class RunMode(str, Enum):
     MULTI_TURN = "multi-turn"
 
 
-class TurnInput(BaseModel):
+@dataclass(slots=True)
+class TurnInput:
     """Input for a single turn containing the stimulus and optional question."""
 
-    model_config = ConfigDict(extra="forbid")
+    stimulus: Stimulus
+    question: str | None = None
 
-    stimulus: Stimulus = Field(..., description="Stimulus shared with all personas for the turn.")
-    question: str | None = Field(
-        default=None, description="Optional follow-up question layered on the stimulus."
-    )
 
+@dataclass(slots=True)
+class RunConfig:
+    """Static configuration for a simulation run.
 
-class RunConfig(BaseModel):
-    """Static configuration for a simulation run."""
+    In single-turn mode only the first entry of ``turns`` is used. ``persona_modes`` optionally
+    maps persona IDs to persona prompt modes. Inputs are validated by the service before the
+    config is built; construction only checks the mode (coercing its string value to
+    :class:`RunMode`) and that ``temperature`` lies in ``[0, 1]``. Turns are not revalidated.
+    """
 
-    model_config = ConfigDict(extra="forbid", protected_namespaces=())
+    run_id: UUID
+    model_name: str
+    temperature: float
+    mode: RunMode = RunMode.SINGLE_TURN
+    turns: list[TurnInput] = field(default_factory=list)
+    persona_modes: dict[UUID, str] = field(default_factory=dict)
+    max_turns: int = field(init=False)
 
-    run_id: UUID = Field(..., description="Identifier for the run, reused for persistence.")
-    model_name: str = Field(..., description="LLM model name used for persona responses.")
-    temperature: float = Field(..., ge=0.0, le=1.0, description="Sampling temperature for the LLM.")
-    mode: RunMode = Field(default=RunMode.SINGLE_TURN, description="Single or multi-turn mode.")
-    turns: list[TurnInput] = Field(
-        default_factory=list,
-        description="Ordered turn inputs. In single-turn mode only the first entry is used.",
-    )
-    persona_modes: dict[UUID, str] = Field(
-        default_factory=dict,
-        description="Optional overrides mapping persona IDs to persona prompt modes.",
-    )
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.temperature <= 1.0:
+            msg = f"temperature must be between 0 and 1 (received {self.temperature})"
+            raise ValueError(msg)
+        self.mode = RunMode(self.mode)
+        # Computed once so graph routing compares against a plain integer.
+        self.max_turns = 1 if self.mode is RunMode.SINGLE_TURN else len(self.turns) or 1
 
 
 class PersonaResponse(BaseModel):
     """LLM response captured for a persona during a turn."""
 
-    model_config = ConfigDict(extra="forbid")
-
     persona_id: UUID = Field(..., description="Identifier of the responding persona.")
     content: str = Field(..., description="Rendered short answer from the persona response.")
     persona_mode: str = Field(..., description="Prompting mode used for the persona.")
@@ -69,6 +75,10 @@ class PersonaResponse(BaseModel):
         default=ObjectionSeverity.LOW,
         description="Highest objection severity inferred from the response.",
     )
+    is_fallback: bool = Field(
+        default=False,
+        description="Whether the reply was unusable and a neutral fallback was recorded instead.",
+    )
 
     def model_post_init(self, __context: Any) -> None:
         # Keep denormalized stance and severity aligned with the structured summary.
@@ -83,14 +93,22 @@ class PersonaResponse(BaseModel):
         object.__setattr__(self, "objection_severity", highest)
 
 
-class GraphState(BaseModel):
-    """Mutable state threaded through the LangGraph execution."""
-
-    model_config = ConfigDict(extra="forbid")
-
-    simulation: SimulationState = Field(..., description="Primary simulation state object.")
-    config: RunConfig = Field(..., description="Run configuration and turn inputs.")
-    current_turn: int = Field(default=0, ge=0, description="Zero-based turn index.")
-    latest_responses: list[PersonaResponse] = Field(
-        default_factory=list, description="Responses collected in the active turn."
-    )
+@dataclass(slots=True)
+class GraphState:
+    """Mutable state threaded through the LangGraph execution.
+
+    A plain dataclass because LangGraph rebuilds the state between nodes and it never crosses an
+    API boundary; ``current_turn`` is the zero-based turn index.
+    """
+
+    simulation: SimulationState
+    config: RunConfig
+    current_turn: int = 0
+    latest_responses: list[PersonaResponse] = field(default_factory=list)
+    # Prompt mode per persona, aligned with ``simulation.personas`` and resolved by init_run_node.
+    resolved_persona_modes: list[str] = field(default_factory=list)
+    # Persona system prompts depend only on run-invariant inputs, so they are built once per
+    # (persona key, mode) and reused, keeping the prompt prefix byte-identical across turns.
+    system_prompts: dict[tuple[str, str], list[BaseMessage]] = field(default_factory=dict)
+    # Transcript write started by evaluator_node; resolves to the number of events it persisted.
+    pending_persist: asyncio.Task[int] | None = None
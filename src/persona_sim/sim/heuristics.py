@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
 from persona_sim.schemas.eval import ObjectionSeverity, WillDecision
 from persona_sim.schemas.sim_state import TrustState
@@ -17,8 +17,6 @@ def _clamp(value: float) -> float:
 class PersonaResponseObjection(BaseModel):
     """Summary of an objection extracted from a persona response."""
 
-    model_config = ConfigDict(extra="forbid")
-
     detail: str = Field(..., description="Short description of the objection raised.")
     severity: ObjectionSeverity = Field(
         default=ObjectionSeverity.LOW, description="Severity classification for the objection."
@@ -28,8 +26,6 @@ class PersonaResponseObjection(BaseModel):
 class PersonaResponseSummary(BaseModel):
     """Structured summary of a persona response used for heuristic updates."""
 
-    model_config = ConfigDict(extra="forbid")
-
     message: str = Field(..., description="Raw response message from the persona.")
     stance: WillDecision = Field(..., description="Overall stance taken in the response.")
     objections: List[PersonaResponseObjection] = Field(
@@ -48,9 +44,9 @@ def apply_persona_heuristics(
     deterministic adjustments.
     """
 
-    trust = previous.trust_score
-    fatigue = previous.fatigue_score
-    base_risk = previous.risk_tolerance
+    trust = previous["trust_score"]
+    fatigue = previous["fatigue_score"]
+    base_risk = previous["risk_tolerance"]
 
     if response.stance is WillDecision.YES:
         trust += 0.05
@@ -70,10 +66,4 @@ def apply_persona_heuristics(
     fatigue = _clamp(fatigue)
     risk_tolerance = _clamp(max(0.0, base_risk - fatigue * 0.2))
 
-    return previous.model_copy(
-        update={
-            "trust_score": trust,
-            "fatigue_score": fatigue,
-            "risk_tolerance": risk_tolerance,
-        }
-    )
+    return TrustState(trust_score=trust, fatigue_score=fatigue, risk_tolerance=risk_tolerance)
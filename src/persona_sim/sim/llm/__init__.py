@@ -1,6 +1,7 @@
 """LLM utilities for simulation components."""
 
+from persona_sim.sim.llm.batcher import LLMBatcher, get_llm_batcher
 from persona_sim.sim.llm.client import get_llm
-from persona_sim.sim.llm.structured import invoke_structured
+from persona_sim.sim.llm.structured import ainvoke_structured, invoke_structured
 
-__all__ = ["get_llm", "invoke_structured"]
+__all__ = ["LLMBatcher", "ainvoke_structured", "get_llm", "get_llm_batcher", "invoke_structured"]
@@ -0,0 +1,148 @@
+"""Coalesce outbound chat-model calls from concurrent simulations."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from functools import lru_cache, partial
+from typing import Any, Final
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+
+from persona_sim.core.config import get_settings
+
+_DEFAULT_MAX_BATCH: Final = 32
+_DEFAULT_MAX_WAIT_MS: Final = 0.0
+
+_BatchedRunnable = Runnable[Sequence[BaseMessage], Any]
+_QueueItem = tuple[_BatchedRunnable, Sequence[BaseMessage], dict[str, Any], "asyncio.Future[Any]"]
+
+
+class LLMBatcher:
+    """Dispatch queued chat-model calls, up to ``max_batch`` at a time.
+
+    Calls are issued as independent requests over the shared client's connection pool; there is
+    no provider batch endpoint, so by default (``max_wait_ms=0``) queued calls are dispatched as
+    soon as the consumer sees them. A positive ``max_wait_ms`` holds the first call that long for
+    others to join it, which only helps to smooth bursts. Cancelling a caller's future cancels its
+    in-flight request.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_batch: int = _DEFAULT_MAX_BATCH,
+        max_wait_ms: float = _DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        self._max_batch = max_batch
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._queue: asyncio.Queue[_QueueItem] | None = None
+        self._consumer: asyncio.Task[None] | None = None
+        self._in_flight: set[asyncio.Task[Any]] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the consumer task is accepting calls."""
+
+        return self._consumer is not None and not self._consumer.done()
+
+    def start(self) -> None:
+        """Start the consumer task on the running event loop."""
+
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._consumer = asyncio.create_task(self._consume(self._queue))
+
+    async def stop(self) -> None:
+        """Dispatch queued calls, wait for in-flight requests, then stop the consumer task."""
+
+        if self._queue is None or self._consumer is None:
+            return
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            self._dispatch(self._drain(self._queue, [self._queue.get_nowait()]))
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self._queue = None
+        self._consumer = None
+
+    def submit(
+        self, llm: _BatchedRunnable, messages: Sequence[BaseMessage], **kwargs: Any
+    ) -> asyncio.Future[Any]:
+        """Queue ``llm.ainvoke(messages, **kwargs)`` and return a future for its result."""
+
+        if self._queue is None or not self.running:
+            raise RuntimeError("LLMBatcher is not running")
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((llm, messages, kwargs, future))
+        return future
+
+    async def _consume(self, queue: asyncio.Queue[_QueueItem]) -> None:
+        while True:
+            batch = [await queue.get()]
+            try:
+                if self._max_wait_seconds > 0 and queue.qsize() < self._max_batch - 1:
+                    await asyncio.sleep(self._max_wait_seconds)
+            finally:
+                # Calls taken off the queue are dispatched even if stop() cancels the window.
+                self._dispatch(self._drain(queue, batch))
+
+    def _drain(self, queue: asyncio.Queue[_QueueItem], batch: list[_QueueItem]) -> list[_QueueItem]:
+        while len(batch) < self._max_batch and not queue.empty():
+            batch.append(queue.get_nowait())
+        return batch
+
+    def _dispatch(self, batch: list[_QueueItem]) -> None:
+        for llm, messages, kwargs, future in batch:
+            if future.done():
+                # The caller was cancelled while the call was still queued.
+                continue
+            task = asyncio.create_task(llm.ainvoke(messages, **kwargs))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            task.add_done_callback(partial(_settle, future))
+            future.add_done_callback(partial(_cancel_if_abandoned, task))
+
+
+def _settle(future: asyncio.Future[Any], task: asyncio.Task[Any]) -> None:
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif (error := task.exception()) is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(task.result())
+
+
+def _cancel_if_abandoned(task: asyncio.Task[Any], future: asyncio.Future[Any]) -> None:
+    if future.cancelled():
+        task.cancel()
+
+
+async def ainvoke_batched(
+    llm: _BatchedRunnable, messages: Sequence[BaseMessage], **kwargs: Any
+) -> Any:
+    """Invoke ``llm`` through the process-wide batcher, or directly when it is not running.
+
+    ``llm`` is a chat model or a runnable built from one, such as a structured-output binding.
+    """
+
+    batcher = get_llm_batcher()
+    if not batcher.running:
+        return await llm.ainvoke(messages, **kwargs)
+    return await batcher.submit(llm, messages, **kwargs)
+
+
+@lru_cache
+def get_llm_batcher() -> LLMBatcher:
+    """Return the process-wide batcher sized from settings."""
+
+    settings = get_settings()
+    return LLMBatcher(max_batch=settings.llm_batch_size, max_wait_ms=settings.llm_batch_wait_ms)
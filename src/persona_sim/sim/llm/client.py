@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Callable, Final, TypeVar
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -35,15 +36,8 @@ def _retry_decorator() -> RetryDecorator:
     )
 
 
-def get_llm(model_name: str, temperature: float) -> BaseChatModel:
-    """
-    Return a LangChain chat model configured for resilience and low hallucination risk.
-
-    The resulting model uses tenacity-driven retries for transient failures and expects
-    the API key to be provided via the ``OPENAI_API_KEY`` environment variable.
-    """
-
-    api_key = _get_api_key()
+@lru_cache(maxsize=16)
+def _build_llm(model_name: str, temperature: float, api_key: str) -> BaseChatModel:
     return ChatOpenAI(
         model=model_name,
         temperature=temperature,
@@ -52,3 +46,15 @@ def get_llm(model_name: str, temperature: float) -> BaseChatModel:
         timeout=_TIMEOUT_SECONDS,
         retry_decorator=_retry_decorator(),
     )
+
+
+def get_llm(model_name: str, temperature: float) -> BaseChatModel:
+    """
+    Return a LangChain chat model configured for resilience and low hallucination risk.
+
+    The resulting model uses tenacity-driven retries for transient failures and expects
+    the API key to be provided via the ``OPENAI_API_KEY`` environment variable. Instances are
+    shared per model, temperature, and key so calls reuse the client's HTTP connection pool.
+    """
+
+    return _build_llm(model_name, temperature, _get_api_key())
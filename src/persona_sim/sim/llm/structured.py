@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+from functools import lru_cache
 from typing import Any, Sequence
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel, ValidationError
-from tenacity import Retrying, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_exponential
 
+from persona_sim.sim.llm.batcher import ainvoke_batched
 from persona_sim.sim.llm.client import get_llm
 
 _DEFAULT_MODEL_NAME = "gpt-4o-mini"
@@ -21,6 +24,18 @@ class StructuredOutputError(RuntimeError):
     """Raised when a structured response cannot be produced."""
 
 
+@lru_cache(maxsize=512)
+def prompt_cache_key(prefix: str) -> str:
+    """Return a short stable key for a prompt prefix, used to route provider-side prompt caching."""
+
+    return hashlib.blake2b(prefix.encode(), digest_size=16).hexdigest()
+
+
+def _invoke_kwargs(cache_key: str | None) -> dict[str, Any]:
+    # OpenAI routes requests sharing a prompt_cache_key to the same prefix cache.
+    return {"extra_body": {"prompt_cache_key": cache_key}} if cache_key else {}
+
+
 def _build_retryer() -> Retrying:
     return Retrying(
         stop=stop_after_attempt(_VALIDATION_ATTEMPTS),
@@ -29,15 +44,46 @@ def _build_retryer() -> Retrying:
     )
 
 
+def _build_async_retryer() -> AsyncRetrying:
+    return AsyncRetrying(
+        stop=stop_after_attempt(_VALIDATION_ATTEMPTS),
+        wait=wait_exponential(multiplier=1, min=1, max=8),
+        reraise=True,
+    )
+
+
 def _normalize_content(message: BaseMessage | str) -> str:
     if isinstance(message, BaseMessage):
         return str(message.content)
     return str(message)
 
 
-def _parse_and_validate(content: str, output_model: type[BaseModel]) -> BaseModel:
-    parsed: Any = json.loads(content)
-    return output_model.model_validate(parsed)
+def _bind_structured_output(
+    llm: BaseChatModel, output_model: type[BaseModel]
+) -> Runnable[Sequence[BaseMessage], Any] | None:
+    # Providers with tool calling return a validated model directly; others fall back to JSON.
+    try:
+        return llm.with_structured_output(output_model)
+    except NotImplementedError:
+        return None
+
+
+def _require_output(result: Any) -> BaseModel:
+    if not isinstance(result, BaseModel):
+        raise StructuredOutputError("Model returned no structured output.")
+    return result
+
+
+def _invoke_bound(
+    structured_llm: Runnable[Sequence[BaseMessage], Any], messages: list[BaseMessage], **kwargs: Any
+) -> BaseModel:
+    return _require_output(structured_llm.invoke(messages, **kwargs))
+
+
+async def _ainvoke_bound(
+    structured_llm: Runnable[Sequence[BaseMessage], Any], messages: list[BaseMessage], **kwargs: Any
+) -> BaseModel:
+    return _require_output(await ainvoke_batched(structured_llm, messages, **kwargs))
 
 
 def _next_messages(
@@ -54,31 +100,91 @@ def _next_messages(
 
 
 def invoke_structured(
-    prompt_messages: Sequence[BaseMessage], output_model: type[BaseModel]
+    prompt_messages: Sequence[BaseMessage],
+    output_model: type[BaseModel],
+    *,
+    cache_key: str | None = None,
 ) -> BaseModel:
     """
     Invoke the LLM and validate the response into the requested Pydantic model.
 
-    If validation fails, the function retries with targeted guidance to correct the output while
-    keeping the API surface narrow enough to swap out providers in the future.
+    Models that support structured output are bound to the schema and return the model directly.
+    Otherwise the JSON reply is validated, retrying with targeted guidance to correct the output
+    while keeping the API surface narrow enough to swap out providers in the future. ``cache_key``
+    (see :func:`prompt_cache_key`) is forwarded to the provider for prompt-prefix caching.
     """
 
     messages: list[BaseMessage] = list(prompt_messages)
     llm: BaseChatModel = get_llm(_DEFAULT_MODEL_NAME, temperature=_STRUCTURED_TEMPERATURE)
     retryer = _build_retryer()
+    invoke_kwargs = _invoke_kwargs(cache_key)
+    structured_llm = _bind_structured_output(llm, output_model)
+    if structured_llm is not None:
+        try:
+            return retryer(_invoke_bound, structured_llm, messages, **invoke_kwargs)
+        except Exception as exc:
+            raise StructuredOutputError("Structured LLM invocation failed after retries.") from exc
+
+    validator = output_model.__pydantic_validator__
+    last_error: Exception | None = None
+    last_content = ""
+
+    for _ in range(_VALIDATION_ATTEMPTS):
+        try:
+            response = retryer(llm.invoke, messages, **invoke_kwargs)
+        except Exception as exc:
+            raise StructuredOutputError("LLM invocation failed after retries.") from exc
+
+        last_content = _normalize_content(response)
+        try:
+            validated: BaseModel = validator.validate_json(last_content)
+            return validated
+        except ValidationError as validation_error:
+            last_error = validation_error
+            messages = _next_messages(prompt_messages, validation_error, last_content)
+
+    raise StructuredOutputError("Failed to produce a valid structured response.") from last_error
+
+
+async def ainvoke_structured(
+    prompt_messages: Sequence[BaseMessage],
+    output_model: type[BaseModel],
+    *,
+    cache_key: str | None = None,
+) -> BaseModel:
+    """Async counterpart of :func:`invoke_structured` using the chat model's native ``ainvoke``.
+
+    Running on the event loop avoids parking a thread-pool worker per concurrent call, and calls
+    are routed through the shared :class:`~persona_sim.sim.llm.batcher.LLMBatcher` when it is
+    running.
+    """
+
+    messages: list[BaseMessage] = list(prompt_messages)
+    llm: BaseChatModel = get_llm(_DEFAULT_MODEL_NAME, temperature=_STRUCTURED_TEMPERATURE)
+    retryer = _build_async_retryer()
+    invoke_kwargs = _invoke_kwargs(cache_key)
+    structured_llm = _bind_structured_output(llm, output_model)
+    if structured_llm is not None:
+        try:
+            return await retryer(_ainvoke_bound, structured_llm, messages, **invoke_kwargs)
+        except Exception as exc:
+            raise StructuredOutputError("Structured LLM invocation failed after retries.") from exc
+
+    validator = output_model.__pydantic_validator__
     last_error: Exception | None = None
     last_content = ""
 
     for _ in range(_VALIDATION_ATTEMPTS):
         try:
-            response = retryer(llm.invoke, messages)
+            response: BaseMessage = await retryer(ainvoke_batched, llm, messages, **invoke_kwargs)
         except Exception as exc:
             raise StructuredOutputError("LLM invocation failed after retries.") from exc
 
         last_content = _normalize_content(response)
         try:
-            return _parse_and_validate(last_content, output_model)
-        except (ValidationError, json.JSONDecodeError) as validation_error:
+            validated: BaseModel = validator.validate_json(last_content)
+            return validated
+        except ValidationError as validation_error:
             last_error = validation_error
             messages = _next_messages(prompt_messages, validation_error, last_content)
 
@@ -9,6 +9,7 @@ from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from persona_sim.schemas.persona import PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
 from persona_sim.schemas.transcript import TranscriptEvent
+from persona_sim.sim.prompts.toon import encode_table
 
 EVALUATOR_DIRECTIVE = (
     "Return only valid JSON matching the EvaluationReport schema without additional commentary."
@@ -17,19 +18,39 @@ EVALUATOR_REMINDERS = (
     "Summarize objections, required proof, and recommend next steps based strictly on the transcript."
 )
 
+# Static prompt text is joined once so every evaluator call shares a byte-identical prefix, which
+# keeps provider-side prompt caching effective; only the sections after it vary per run.
+_SYSTEM_CONTENT = "\n".join(
+    [
+        "You are an impartial evaluator converting the conversation into an EvaluationReport JSON.",
+        EVALUATOR_DIRECTIVE,
+        EVALUATOR_REMINDERS,
+    ]
+)
+_REPORT_INSTRUCTION = (
+    "Produce the EvaluationReport JSON with fields: will_buy, will_use_daily, trust_delta, "
+    "top_objections, required_proof, recommended_next_steps."
+)
+_TABLE_NOTE = (
+    "Personas and transcript are tables: a name{field|...} header, then one |-separated row per "
+    "record."
+)
+_PERSONA_FIELDS = ("id", "name", "role", "locale")
+_EVENT_FIELDS = ("timestamp", "actor", "type", "content")
+
 
 def _summarize_personas(personas: Iterable[PersonaSpec]) -> str:
-    summaries: List[str] = []
-    for persona in personas:
-        summaries.append(f"{persona.name} ({persona.role}, {persona.locale}) [{persona.id}]")
-    return "; ".join(summaries) if summaries else "No personas provided."
+    rows = [(persona.id, persona.name, persona.role, persona.locale) for persona in personas]
+    return encode_table("personas", _PERSONA_FIELDS, rows) if rows else "No personas provided."
 
 
 def _summarize_events(events: Iterable[TranscriptEvent]) -> str:
-    lines: List[str] = []
-    for event in events:
-        lines.append(f"{event.timestamp} - {event.actor} ({event.event_type.value}): {event.content}")
-    return "\n".join(lines) if lines else "No transcript events recorded."
+    rows = [
+        (event.timestamp, event.actor, event.event_type.value, event.content) for event in events
+    ]
+    if not rows:
+        return "No transcript events recorded."
+    return encode_table("transcript", _EVENT_FIELDS, rows)
 
 
 def build_evaluator_prompt(
@@ -38,14 +59,6 @@ def build_evaluator_prompt(
     scenario: ScenarioSpec,
 ) -> List[BaseMessage]:
     """Build the evaluator prompt requesting a structured EvaluationReport JSON output."""
-    system_content = "\n".join(
-        [
-            "You are an impartial evaluator converting the conversation into an EvaluationReport JSON.",
-            EVALUATOR_DIRECTIVE,
-            EVALUATOR_REMINDERS,
-        ]
-    )
-
     transcript_section = _summarize_events(transcript_events)
     persona_section = _summarize_personas(personas)
     scenario_section = (
@@ -54,15 +67,11 @@ def build_evaluator_prompt(
         f"Success criteria: {', '.join(scenario.success_criteria) if scenario.success_criteria else 'none'}."
     )
 
-    user_content = "\n\n".join(
-        [
-            "Produce the EvaluationReport JSON with fields: will_buy, will_use_daily, trust_delta, "
-            "top_objections, required_proof, recommended_next_steps.",
-            f"Personas: {persona_section}",
-            f"Scenario: {scenario_section}",
-            "Transcript:",
-            transcript_section,
-        ]
+    user_content = (
+        f"{_REPORT_INSTRUCTION}\n{_TABLE_NOTE}\n\n"
+        f"{persona_section}\n\n"
+        f"Scenario: {scenario_section}\n\n"
+        f"{transcript_section}"
     )
 
-    return [SystemMessage(content=system_content), HumanMessage(content=user_content)]
+    return [SystemMessage(content=_SYSTEM_CONTENT), HumanMessage(content=user_content)]
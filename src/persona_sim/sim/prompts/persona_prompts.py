@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Sequence
 
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
@@ -36,37 +37,98 @@ _MODE_DESCRIPTORS = {
     "daily_user": "You are the daily user who cares most about usability, stability, and workflow fit.",
     "anti_persona": "You are an anti-persona who is skeptical, risk-averse, and resistant to adoption.",
 }
+_SYSTEM_PREAMBLE = "You are a simulated persona in a product discovery conversation."
+_SYSTEM_DIRECTIVES = "\n".join(
+    [GROUNDING_DIRECTIVE, CLARIFICATION_DIRECTIVE, STRUCTURE_DIRECTIVE, WORD_LIMIT_DIRECTIVE]
+)
+_USER_DIRECTIVES = f"{STRUCTURE_DIRECTIVE}\n{WORD_LIMIT_DIRECTIVE}"
+_BRIEF_CACHE_SIZE = 512
 
 
 def _format_persona_brief(persona: PersonaSpec) -> str:
-    incentives = "; ".join(persona.incentives) if persona.incentives else "None listed"
-    fears = "; ".join(persona.fears) if persona.fears else "None listed"
+    # Specs are unhashable models, so the brief is memoized on the fields it renders.
     constraints = persona.constraints
-    constraint_summary = (
-        f"Time/week: {constraints.time_per_week_minutes} minutes; "
-        f"Budget: £{constraints.budget_gbp}; "
-        f"AI trust: {constraints.ai_trust_level}/5; "
-        f"Authority: {constraints.authority_level.value}"
+    return _persona_brief(
+        persona.name,
+        persona.role,
+        persona.locale,
+        persona.sector,
+        tuple(persona.incentives),
+        tuple(persona.fears),
+        constraints["time_per_week_minutes"],
+        constraints["budget_gbp"],
+        constraints["ai_trust_level"],
+        constraints["authority_level"].value,
+        persona.communication_style,
     )
-    communication = (
-        persona.communication_style if persona.communication_style else "No specific preference stated."
+
+
+@lru_cache(maxsize=_BRIEF_CACHE_SIZE)
+def _persona_brief(
+    name: str,
+    role: str,
+    locale: str,
+    sector: str | None,
+    incentives: tuple[str, ...],
+    fears: tuple[str, ...],
+    time_per_week_minutes: int,
+    budget_gbp: int,
+    ai_trust_level: int,
+    authority_level: str,
+    communication_style: str | None,
+) -> str:
+    incentive_summary = "; ".join(incentives) if incentives else "None listed"
+    fear_summary = "; ".join(fears) if fears else "None listed"
+    constraint_summary = (
+        f"Time/week: {time_per_week_minutes} minutes; "
+        f"Budget: £{budget_gbp}; "
+        f"AI trust: {ai_trust_level}/5; "
+        f"Authority: {authority_level}"
     )
+    communication = communication_style if communication_style else "No specific preference stated."
     return (
-        f"Persona {persona.name} ({persona.role}, {persona.locale}) "
-        f"Sector: {persona.sector or 'unspecified'}. "
-        f"Incentives: {incentives}. Fears: {fears}. "
+        f"Persona {name} ({role}, {locale}) "
+        f"Sector: {sector or 'unspecified'}. "
+        f"Incentives: {incentive_summary}. Fears: {fear_summary}. "
         f"Constraints: {constraint_summary}. "
         f"Communication style: {communication}"
     )
 
 
 def _format_scenario_brief(scenario: ScenarioSpec) -> str:
-    stressors = "; ".join(scenario.stressors) if scenario.stressors else "None listed"
-    success_criteria = "; ".join(scenario.success_criteria) if scenario.success_criteria else "None listed"
+    return _scenario_brief(
+        scenario.title,
+        str(scenario.id),
+        scenario.context,
+        scenario.deadline,
+        tuple(scenario.stressors),
+        tuple(scenario.success_criteria),
+    )
+
+
+@lru_cache(maxsize=_BRIEF_CACHE_SIZE)
+def _scenario_brief(
+    title: str,
+    scenario_id: str,
+    context: str,
+    deadline: str | None,
+    stressors: tuple[str, ...],
+    success_criteria: tuple[str, ...],
+) -> str:
+    stressor_summary = "; ".join(stressors) if stressors else "None listed"
+    criteria_summary = "; ".join(success_criteria) if success_criteria else "None listed"
     return (
-        f"Scenario '{scenario.title}' ({scenario.id}): {scenario.context} "
-        f"Deadline: {scenario.deadline or 'not specified'}. "
-        f"Stressors: {stressors}. Success criteria: {success_criteria}."
+        f"Scenario '{title}' ({scenario_id}): {context} "
+        f"Deadline: {deadline or 'not specified'}. "
+        f"Stressors: {stressor_summary}. Success criteria: {criteria_summary}."
+    )
+
+
+@lru_cache(maxsize=_BRIEF_CACHE_SIZE)
+def _system_prompt_content(mode: str, persona_brief: str, scenario_brief: str) -> str:
+    return (
+        f"{_SYSTEM_PREAMBLE}\n{_MODE_DESCRIPTORS[mode]}\n{persona_brief}\n{scenario_brief}\n"
+        f"{_SYSTEM_DIRECTIVES}"
     )
 
 
@@ -77,36 +139,21 @@ def build_persona_system_prompt(
     if mode not in _MODE_DESCRIPTORS:
         raise ValueError(f"Unsupported mode '{mode}'. Expected one of {sorted(_MODE_DESCRIPTORS)}.")
 
-    persona_brief = _format_persona_brief(persona)
-    scenario_brief = _format_scenario_brief(scenario)
-    mode_brief = _MODE_DESCRIPTORS[mode]
-
-    content = "\n".join(
-        [
-            "You are a simulated persona in a product discovery conversation.",
-            mode_brief,
-            persona_brief,
-            scenario_brief,
-            GROUNDING_DIRECTIVE,
-            CLARIFICATION_DIRECTIVE,
-            STRUCTURE_DIRECTIVE,
-            WORD_LIMIT_DIRECTIVE,
-        ]
+    content = _system_prompt_content(
+        mode, _format_persona_brief(persona), _format_scenario_brief(scenario)
     )
-
     return [SystemMessage(content=content)]
 
 
 def build_persona_user_prompt(stimulus: Stimulus, question: str | None) -> Sequence[BaseMessage]:
     """Build the user-facing prompt combining the stimulus and optional question."""
-    stimulus_lines = [
-        f"Stimulus type: {stimulus.type.value}",
-        f"Content: {stimulus.content}",
-    ]
-    if stimulus.attachments:
-        stimulus_lines.append(f"Attachments: {', '.join(stimulus.attachments)}")
-
+    attachments = (
+        f"\nAttachments: {', '.join(stimulus.attachments)}" if stimulus.attachments else ""
+    )
     question_line = f"Question: {question}" if question else "Respond based on the stimulus."
-    user_content = "\n".join(stimulus_lines + [question_line, STRUCTURE_DIRECTIVE, WORD_LIMIT_DIRECTIVE])
+    user_content = (
+        f"Stimulus type: {stimulus.type.value}\nContent: {stimulus.content}{attachments}\n"
+        f"{question_line}\n{_USER_DIRECTIVES}"
+    )
 
     return [HumanMessage(content=user_content)]
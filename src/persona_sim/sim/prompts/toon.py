@@ -0,0 +1,28 @@
+"""Compact schema-once tables for repeated records embedded in prompts.
+
+A table names its fields once in a header, ``name{field|field}``, followed by one ``|``-separated
+row per record, so repeated records do not repeat their keys the way JSON or prose would.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "|": "\\|", "\n": "\\n", "\r": "\\r"})
+
+
+def _cell(value: object) -> str:
+    if value is None:
+        return ""
+    return str(value).translate(_ESCAPES)
+
+
+def encode_table(name: str, fields: Sequence[str], rows: Iterable[Sequence[object]]) -> str:
+    """Render ``rows`` under a single ``name{field|...}`` header, one line per row.
+
+    Pipes, backslashes, and line breaks inside values are escaped so every row stays on one line.
+    """
+
+    lines = [f"{name}{{{'|'.join(fields)}}}"]
+    lines.extend("|".join(_cell(value) for value in row) for row in rows)
+    return "\n".join(lines)
@@ -8,23 +8,33 @@ graph, and persistence is delegated to repositories.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from itertools import chain, islice, repeat
 from typing import Sequence
 
+from cachetools import LRUCache
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from persona_sim.db.models import SimulationStatus
 from persona_sim.core.config import get_settings
-from persona_sim.db.repositories import get_run, set_status
+from persona_sim.core.ids import uuid7
+from persona_sim.db.repositories import get_run, get_transcript_page, set_status
+from persona_sim.db.run_cache import cache_run, get_cached_run
+from persona_sim.db.writer import BackgroundWriter, StatusWrite
 from persona_sim.schemas.persona import PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
 from persona_sim.schemas.sim_state import SimulationState
 from persona_sim.schemas.stimulus import Stimulus
+from persona_sim.schemas.transcript import TranscriptPage
 from persona_sim.sim.errors import NotFoundError, RunFailedError, ValidationError
 from persona_sim.sim.graph import GraphDependencies, GraphState, RunConfig, RunMode, TurnInput
 from persona_sim.sim.graph.graph import build_simulation_graph
 from persona_sim.sim.graph.nodes import EvaluationResponder, PersonaResponder
 
+_TERMINAL_STATUSES = frozenset({SimulationStatus.COMPLETED, SimulationStatus.FAILED})
+_RUN_MODES = {mode.value: mode for mode in RunMode}
+
 
 class SimulationService:
     """Coordinate simulation runs and retrieval."""
@@ -37,6 +47,7 @@ class SimulationService:
         evaluation_responder: EvaluationResponder | None = None,
         model_name: str | None = None,
         temperature: float | None = None,
+        writer: BackgroundWriter | None = None,
     ) -> None:
         settings = get_settings()
         self._session_factory = session_factory
@@ -44,6 +55,13 @@ class SimulationService:
         self._temperature = temperature if temperature is not None else settings.default_temperature
         self._persona_responder = persona_responder
         self._evaluation_responder = evaluation_responder
+        self._trust_db_payloads = settings.trust_db_payloads
+        self._persona_concurrency = settings.persona_concurrency
+        self._response_cache_size = settings.persona_response_cache_size
+        self._writer = writer
+        # Dependencies are fixed for the service's lifetime and compiled graphs are safe to invoke
+        # concurrently, so the graph is built once rather than per run.
+        self._graph = build_simulation_graph(self._build_dependencies()).compile()
 
     async def start_run(
         self,
@@ -57,12 +75,13 @@ class SimulationService:
         """Validate inputs, execute the LangGraph run, and return the run identifier."""
 
         self._validate_inputs(personas=personas, stimuli=stimuli, steps=steps, run_mode=run_mode)
-        mode = RunMode(run_mode)
-        run_id = uuid.uuid4()
-        turns = []
-        for idx in range(steps):
-            stimulus = stimuli[min(idx, len(stimuli) - 1)]
-            turns.append(TurnInput(stimulus=stimulus, question=stimulus.question))
+        mode = _RUN_MODES[run_mode]
+        run_id = uuid7()
+        # Steps beyond the supplied stimuli repeat the last one.
+        padded_stimuli = islice(chain(stimuli, repeat(stimuli[-1])), steps)
+        turns = [
+            TurnInput(stimulus=stimulus, question=stimulus.question) for stimulus in padded_stimuli
+        ]
         config = RunConfig(
             run_id=run_id,
             model_name=self._model_name,
@@ -85,12 +104,8 @@ class SimulationService:
             latest_responses=[],
         )
 
-        deps = self._build_dependencies()
-
-        graph = build_simulation_graph(deps).compile()
         try:
-            result = await graph.ainvoke(initial_state)
-            _ = GraphState.model_validate(result)
+            await self._graph.ainvoke(initial_state)
         except Exception as exc:  # pragma: no cover - propagated as domain error
             await self._mark_run_failed(run_id)
             raise RunFailedError("Simulation run failed") from exc
@@ -98,15 +113,46 @@ class SimulationService:
         return run_id
 
     async def get_run(self, run_id: uuid.UUID) -> SimulationState:
-        """Retrieve a completed or in-flight simulation."""
+        """Retrieve a completed or in-flight simulation.
+
+        Finished runs are immutable, so their projection is served from an in-process TTL cache.
+        """
+
+        cached = get_cached_run(run_id)
+        if cached is not None:
+            return cached
 
         async with self._session_factory() as session:
-            dto = await get_run(session, run_id)
+            dto = await get_run(session, run_id, trusted=self._trust_db_payloads)
         if dto is None:
             raise NotFoundError(f"Run {run_id} not found")
-        return dto.to_simulation_state()
+        state = dto.to_simulation_state()
+        if dto.status in _TERMINAL_STATUSES:
+            cache_run(run_id, state)
+        return state
+
+    async def get_transcript(
+        self, run_id: uuid.UUID, *, since_event_id: int | None = None, limit: int = 256
+    ) -> TranscriptPage:
+        """Return transcript events recorded after ``since_event_id`` for incremental polling."""
+
+        async with self._session_factory() as session:
+            page = await get_transcript_page(
+                session, run_id, since_event_id=since_event_id, limit=limit
+            )
+        if page is None:
+            raise NotFoundError(f"Run {run_id} not found")
+        return page
 
     async def _mark_run_failed(self, run_id: uuid.UUID) -> None:
+        # The caller already receives RunFailedError, so the status update need not be awaited;
+        # a full writer queue falls back to the inline update below.
+        if self._writer is not None and self._writer.running:
+            try:
+                self._writer.enqueue(StatusWrite(run_id=run_id, status=SimulationStatus.FAILED))
+                return
+            except asyncio.QueueFull:
+                pass
         try:
             async with self._session_factory() as session:
                 await set_status(session, run_id=run_id, status=SimulationStatus.FAILED)
@@ -125,19 +171,19 @@ class SimulationService:
             raise ValidationError("At least one stimulus is required")
         if steps <= 0:
             raise ValidationError("steps must be positive")
-        try:
-            RunMode(run_mode)
-        except ValueError as exc:  # pragma: no cover - simple value guard
-            raise ValidationError(f"Unsupported run mode: {run_mode}") from exc
+        if run_mode not in _RUN_MODES:
+            raise ValidationError(f"Unsupported run mode: {run_mode}")
 
     def _build_dependencies(self) -> GraphDependencies:
-        persona_responder = self._persona_responder
-        evaluation_responder = self._evaluation_responder
-
-        kwargs = {}
-        if persona_responder is not None:
-            kwargs["persona_responder"] = persona_responder
-        if evaluation_responder is not None:
-            kwargs["evaluation_responder"] = evaluation_responder
-
-        return GraphDependencies(session_factory=self._session_factory, **kwargs)
+        deps = GraphDependencies(
+            session_factory=self._session_factory,
+            persona_concurrency=self._persona_concurrency,
+            response_cache=(
+                LRUCache(maxsize=self._response_cache_size) if self._response_cache_size else None
+            ),
+        )
+        if self._persona_responder is not None:
+            deps.persona_responder = self._persona_responder
+        if self._evaluation_responder is not None:
+            deps.evaluation_responder = self._evaluation_responder
+        return deps
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from structlog.testing import capture_logs
+
+from persona_sim.db.base import Base
+from persona_sim.db.models import SimulationStatus
+from persona_sim.db.repositories import create_run, get_run
+from persona_sim.db.writer import BackgroundWriter, EvaluationWrite, StatusWrite
+from persona_sim.schemas.eval import EvaluationReport, WillDecision
+from persona_sim.schemas.scenario import ScenarioSpec
+
+
+async def _session_factory() -> async_sessionmaker:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def _report() -> EvaluationReport:
+    return EvaluationReport(
+        will_buy=WillDecision.NO,
+        will_use_daily=WillDecision.RELUCTANT,
+        trust_delta=-0.1,
+    )
+
+
+async def _exercise_writer() -> None:
+    session_factory = await _session_factory()
+    run_id = uuid4()
+    async with session_factory() as session:
+        await create_run(
+            session,
+            run_id=run_id,
+            scenario=ScenarioSpec(id=uuid4(), title="Launch", context="Test context"),
+            personas=[],
+            mode="single-turn",
+            model_name="gpt-4o-mini",
+            temperature=0.0,
+        )
+
+    writer = BackgroundWriter(session_factory, batch_size=4)
+    writer.start()
+    writer.enqueue(EvaluationWrite(run_id=run_id, report=_report()))
+    writer.enqueue(StatusWrite(run_id=run_id, status=SimulationStatus.FAILED))
+    await writer.stop()
+    assert not writer.running
+
+    async with session_factory() as session:
+        stored = await get_run(session, run_id)
+    assert stored is not None
+    assert stored.status == SimulationStatus.FAILED
+    assert stored.evaluation == _report()
+
+
+def test_background_writer_applies_queued_writes() -> None:
+    asyncio.run(_exercise_writer())
+
+
+async def _exercise_failed_write_in_batch() -> None:
+    session_factory = await _session_factory()
+    run_id = uuid4()
+    async with session_factory() as session:
+        await create_run(
+            session,
+            run_id=run_id,
+            scenario=ScenarioSpec(id=uuid4(), title="Launch", context="Test context"),
+            personas=[],
+            mode="single-turn",
+            model_name="gpt-4o-mini",
+            temperature=0.0,
+        )
+
+    writer = BackgroundWriter(session_factory, batch_size=4, max_queue_size=2)
+    writer.start()
+    # Both writes are queued before the consumer runs, so they land in the same batch.
+    missing_run_id = uuid4()
+    writer.enqueue(StatusWrite(run_id=missing_run_id, status=SimulationStatus.FAILED))
+    writer.enqueue(StatusWrite(run_id=run_id, status=SimulationStatus.FAILED))
+    with pytest.raises(asyncio.QueueFull):
+        writer.enqueue(StatusWrite(run_id=run_id, status=SimulationStatus.COMPLETED))
+
+    with capture_logs() as logs:
+        await writer.stop()
+
+    assert [entry["run_id"] for entry in logs if entry["event"] == "background_write_failed"] == [
+        str(missing_run_id)
+    ]
+
+    async with session_factory() as session:
+        stored = await get_run(session, run_id)
+    assert stored is not None
+    assert stored.status == SimulationStatus.FAILED
+
+
+def test_background_writer_isolates_failed_writes_and_bounds_its_queue() -> None:
+    asyncio.run(_exercise_failed_write_in_batch())
+
+
+def test_background_writer_rejects_writes_when_stopped() -> None:
+    writer = BackgroundWriter(async_sessionmaker())
+
+    with pytest.raises(RuntimeError):
+        writer.enqueue(StatusWrite(run_id=uuid4(), status=SimulationStatus.FAILED))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from persona_sim.core.config import Settings
+from persona_sim.db.session import (
+    _connect_args,
+    _pool_options,
+    get_engine,
+    get_sessionmaker,
+    warm_connection_pool,
+)
+
+
+def _settings(database_url: str) -> Settings:
+    return Settings(
+        DATABASE_URL=database_url, DB_POOL_SIZE=4, DB_MAX_OVERFLOW=2, DB_POOL_TIMEOUT_SECONDS=5
+    )
+
+
+def _options(settings: Settings) -> dict[str, Any]:
+    return _pool_options(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle_seconds=settings.db_pool_recycle_seconds,
+        pool_timeout_seconds=settings.db_pool_timeout_seconds,
+    )
+
+
+def test_pool_options_size_file_backed_databases(tmp_path: Path) -> None:
+    options = _options(_settings(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"))
+
+    assert options["pool_size"] == 4
+    assert options["max_overflow"] == 2
+    assert options["pool_pre_ping"] is True
+    assert options["pool_use_lifo"] is True
+    assert options["pool_timeout"] == 5
+
+
+def test_pool_options_skip_in_memory_sqlite() -> None:
+    assert _options(_settings("sqlite+aiosqlite:///:memory:")) == {}
+
+
+def test_connect_args_enable_prepared_statements_for_postgres_drivers() -> None:
+    assert _connect_args("postgresql+psycopg://user@localhost/personas") == {
+        "prepare_threshold": 5
+    }
+    assert _connect_args("postgresql+asyncpg://user@localhost/personas") == {
+        "statement_cache_size": 1024
+    }
+    assert _connect_args("sqlite+aiosqlite:///./personas.db") == {}
+
+
+def test_warm_connection_pool_opens_pool_size_connections(tmp_path: Path) -> None:
+    settings = _settings(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+    engine = create_async_engine(settings.database_url, **_options(settings))
+
+    async def _warm() -> int:
+        try:
+            opened = await warm_connection_pool(engine)
+            assert engine.sync_engine.pool.checkedin() == 4
+            return opened
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(_warm()) == 4
+
+
+def test_engines_and_sessionmakers_are_shared_per_database_configuration(tmp_path: Path) -> None:
+    first = _settings(f"sqlite+aiosqlite:///{tmp_path / 'first.db'}")
+    second = _settings(f"sqlite+aiosqlite:///{tmp_path / 'second.db'}")
+
+    assert get_engine(first) is get_engine(_settings(first.database_url))
+    assert get_engine(first) is not get_engine(second)
+    assert get_sessionmaker(first) is get_sessionmaker(_settings(first.database_url))
+    assert get_sessionmaker(first).kw["bind"] is get_engine(first)
+
+
+def test_file_backed_sqlite_connections_use_wal(tmp_path: Path) -> None:
+    engine = get_engine(_settings(f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}"))
+
+    async def _journal_mode() -> str:
+        try:
+            async with engine.connect() as connection:
+                return (await connection.execute(text("PRAGMA journal_mode"))).scalar_one()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(_journal_mode()) == "wal"
@@ -1,11 +1,20 @@
+import asyncio
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from persona_sim.app.main import app
+from persona_sim.db import health as db_health
+from persona_sim.db.health import DBHealthTracker
+
 
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    return TestClient(app)
 
-def test_health_endpoint() -> None:
-    client = TestClient(app)
 
+def test_health_endpoint(client: TestClient) -> None:
     response = client.get("/health")
 
     assert response.status_code == 200
@@ -13,3 +22,49 @@ def test_health_endpoint() -> None:
     assert body["status"] == "ok"
     assert "environment" in body
     assert body["database"] in {"ok", "unavailable"}
+
+
+def test_openapi_document_is_served_from_cache(client: TestClient) -> None:
+    response = client.get("/openapi.json")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == app.openapi()
+    assert "/v1/simulations" in response.json()["paths"]
+    assert client.get("/docs").status_code == 200
+
+
+def test_db_health_tracker_reuses_fresh_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+
+    async def _verify(engine: object = None) -> None:
+        calls.append(engine)
+
+    monkeypatch.setattr(db_health, "verify_database_connection", _verify)
+    tracker = DBHealthTracker(ttl_seconds=60.0)
+
+    async def _probe() -> list[bool]:
+        return [await tracker.check(), await tracker.check()]
+
+    assert asyncio.run(_probe()) == [True, True]
+    assert len(calls) == 1
+
+    tracker.expire()
+    assert asyncio.run(tracker.check()) is True
+    assert len(calls) == 2
+
+
+def test_db_health_tracker_expires_on_pool_invalidation() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    tracker = DBHealthTracker(ttl_seconds=60.0)
+    tracker.watch(engine)
+
+    async def _probe_and_invalidate() -> None:
+        assert await tracker.check(engine) is True
+        assert tracker._is_fresh()
+        async with engine.connect() as connection:
+            await connection.invalidate()
+        await engine.dispose()
+
+    asyncio.run(_probe_and_invalidate())
+    assert not tracker._is_fresh()
@@ -19,9 +19,9 @@ def test_yes_increases_trust_and_reduces_fatigue() -> None:
 
     updated = apply_persona_heuristics(previous=previous, response=response, mode="economic_buyer")
 
-    assert updated.trust_score == 0.55
-    assert updated.fatigue_score == 0.07
-    assert updated.risk_tolerance == pytest.approx(0.686)
+    assert updated["trust_score"] == 0.55
+    assert updated["fatigue_score"] == 0.07
+    assert updated["risk_tolerance"] == pytest.approx(0.686)
 
 
 def test_reluctant_decreases_trust_and_increases_fatigue() -> None:
@@ -30,9 +30,9 @@ def test_reluctant_decreases_trust_and_increases_fatigue() -> None:
 
     updated = apply_persona_heuristics(previous=previous, response=response, mode="daily_user")
 
-    assert updated.trust_score == pytest.approx(0.58)
-    assert updated.fatigue_score == pytest.approx(0.22)
-    assert updated.risk_tolerance == pytest.approx(0.756)
+    assert updated["trust_score"] == pytest.approx(0.58)
+    assert updated["fatigue_score"] == pytest.approx(0.22)
+    assert updated["risk_tolerance"] == pytest.approx(0.756)
 
 
 def test_no_decreases_trust_and_increases_fatigue() -> None:
@@ -41,9 +41,9 @@ def test_no_decreases_trust_and_increases_fatigue() -> None:
 
     updated = apply_persona_heuristics(previous=previous, response=response, mode="anti_persona")
 
-    assert updated.trust_score == pytest.approx(0.35)
-    assert updated.fatigue_score == pytest.approx(0.03)
-    assert updated.risk_tolerance == pytest.approx(0.594)
+    assert updated["trust_score"] == pytest.approx(0.35)
+    assert updated["fatigue_score"] == pytest.approx(0.03)
+    assert updated["risk_tolerance"] == pytest.approx(0.594)
 
 
 def test_high_severity_objections_stack() -> None:
@@ -59,9 +59,9 @@ def test_high_severity_objections_stack() -> None:
 
     updated = apply_persona_heuristics(previous=previous, response=response, mode="economic_buyer")
 
-    assert updated.trust_score == pytest.approx(0.49)
-    assert updated.fatigue_score == pytest.approx(0.01)
-    assert updated.risk_tolerance == pytest.approx(0.898)
+    assert updated["trust_score"] == pytest.approx(0.49)
+    assert updated["fatigue_score"] == pytest.approx(0.01)
+    assert updated["risk_tolerance"] == pytest.approx(0.898)
 
 
 def test_risk_tolerance_clamped_and_decreases_with_fatigue() -> None:
@@ -70,5 +70,5 @@ def test_risk_tolerance_clamped_and_decreases_with_fatigue() -> None:
 
     updated = apply_persona_heuristics(previous=previous, response=response, mode="daily_user")
 
-    assert updated.fatigue_score == pytest.approx(0.93)
-    assert updated.risk_tolerance == pytest.approx(0.814)
+    assert updated["fatigue_score"] == pytest.approx(0.93)
+    assert updated["risk_tolerance"] == pytest.approx(0.814)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import time
+
+from persona_sim.core.ids import uuid7
+
+
+def test_uuid7_sets_version_variant_and_timestamp() -> None:
+    before_ms = time.time_ns() // 1_000_000
+    value = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before_ms <= value.int >> 80 <= after_ms
+
+
+def test_uuid7_sorts_by_creation_time() -> None:
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first < second
+    assert str(first) < str(second)
+
+
+def test_uuid7_refills_buffered_randomness_without_repeats() -> None:
+    values = {uuid7() for _ in range(3 * 256 + 1)}
+
+    assert len(values) == 3 * 256 + 1
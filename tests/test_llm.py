@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 from typing import Any
 
 import pytest
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
 from pydantic import BaseModel
 
 from persona_sim.sim.llm import client, structured
+from persona_sim.sim.llm.batcher import LLMBatcher
 
 
 class _StubChatModel:
     def __init__(self, responses: list[str | Exception]):
         self._responses = responses
         self.calls: list[Sequence[BaseMessage]] = []
+        self.call_kwargs: list[dict[str, Any]] = []
 
-    def invoke(self, messages: Sequence[BaseMessage]) -> AIMessage:
+    def invoke(self, messages: Sequence[BaseMessage], **kwargs: Any) -> AIMessage:
         self.calls.append(messages)
+        self.call_kwargs.append(kwargs)
         if not self._responses:
             raise RuntimeError("No responses queued.")
 
@@ -25,6 +30,12 @@ class _StubChatModel:
             raise next_response
         return AIMessage(content=next_response)
 
+    async def ainvoke(self, messages: Sequence[BaseMessage], **kwargs: Any) -> AIMessage:
+        return self.invoke(messages, **kwargs)
+
+    def with_structured_output(self, schema: type[BaseModel]) -> None:
+        raise NotImplementedError
+
 
 class _SampleOutput(BaseModel):
     title: str
@@ -46,6 +57,7 @@ def test_get_llm_configures_chat_model(monkeypatch: pytest.MonkeyPatch) -> None:
 
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     monkeypatch.setattr(client, "ChatOpenAI", _ChatOpenAIStub)
+    client._build_llm.cache_clear()
 
     model = client.get_llm(model_name="gpt-4o-mini", temperature=0.25)
 
@@ -55,6 +67,9 @@ def test_get_llm_configures_chat_model(monkeypatch: pytest.MonkeyPatch) -> None:
     assert captured_kwargs["temperature"] == 0.25
     assert captured_kwargs["max_retries"] > 0
     assert captured_kwargs["timeout"] > 0
+    assert client.get_llm(model_name="gpt-4o-mini", temperature=0.25) is model
+    assert client.get_llm(model_name="gpt-4o-mini", temperature=0.5) is not model
+    client._build_llm.cache_clear()
 
 
 def test_invoke_structured_retries_and_returns_validated(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -86,3 +101,137 @@ def test_invoke_structured_raises_after_retries(monkeypatch: pytest.MonkeyPatch)
         structured.invoke_structured(prompt, _SampleOutput)
 
     assert len(stub.calls) == 3
+
+
+def test_ainvoke_structured_retries_and_returns_validated(monkeypatch: pytest.MonkeyPatch) -> None:
+    stub = _StubChatModel(
+        responses=[
+            '{"title": "Hello"}',
+            '{"title": "Hello", "count": 3}',
+        ]
+    )
+    monkeypatch.setattr(structured, "get_llm", lambda *_, **__: stub)
+
+    prompt = [HumanMessage(content="Give me a title and count.")]
+
+    result = asyncio.run(structured.ainvoke_structured(prompt, _SampleOutput))
+
+    assert result.count == 3
+    assert len(stub.calls) == 2
+    assert "Fix your JSON" in stub.calls[-1][-1].content
+
+
+def test_llm_batcher_dispatches_queued_calls_together() -> None:
+    class _CountingChatModel:
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+
+        async def ainvoke(self, messages: Sequence[BaseMessage]) -> AIMessage:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            if messages[0].content == "fail":
+                raise RuntimeError("boom")
+            return AIMessage(content=f"echo {messages[0].content}")
+
+    async def _run() -> None:
+        llm = _CountingChatModel()
+        batcher = LLMBatcher(max_batch=3, max_wait_ms=50)
+        batcher.start()
+        futures = [
+            batcher.submit(llm, [HumanMessage(content=content)])
+            for content in ("a", "b", "fail", "c")
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        await batcher.stop()
+
+        assert [getattr(result, "content", None) for result in results] == [
+            "echo a",
+            "echo b",
+            None,
+            "echo c",
+        ]
+        assert isinstance(results[2], RuntimeError)
+        assert llm.peak == 3
+        assert not batcher.running
+
+    asyncio.run(_run())
+
+
+def test_llm_batcher_stop_dispatches_calls_held_in_the_wait_window() -> None:
+    async def _run() -> None:
+        stub = _StubChatModel(["done"])
+        batcher = LLMBatcher(max_batch=3, max_wait_ms=1000)
+        batcher.start()
+        future = batcher.submit(stub, [HumanMessage(content="pending")])
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+
+        assert future.done()
+        assert future.result().content == "done"
+
+    asyncio.run(asyncio.wait_for(_run(), timeout=1))
+
+
+def test_llm_batcher_cancels_the_request_of_a_cancelled_caller() -> None:
+    class _SlowChatModel:
+        def __init__(self) -> None:
+            self.cancelled = False
+
+        async def ainvoke(self, messages: Sequence[BaseMessage]) -> AIMessage:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+            return AIMessage(content="late")
+
+    async def _run() -> None:
+        llm = _SlowChatModel()
+        batcher = LLMBatcher()
+        batcher.start()
+        future = batcher.submit(llm, [HumanMessage(content="slow")])
+        await asyncio.sleep(0.01)
+        future.cancel()
+        await batcher.stop()
+
+        assert llm.cancelled
+
+    asyncio.run(asyncio.wait_for(_run(), timeout=1))
+
+
+def test_ainvoke_structured_prefers_native_structured_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bound_schemas: list[type[BaseModel]] = []
+
+    class _ToolCallingChatModel(_StubChatModel):
+        def with_structured_output(self, schema: type[BaseModel]) -> RunnableLambda:
+            bound_schemas.append(schema)
+            return RunnableLambda(lambda messages: schema(title="Native", count=len(messages)))
+
+    stub = _ToolCallingChatModel(responses=[])
+    monkeypatch.setattr(structured, "get_llm", lambda *_, **__: stub)
+
+    prompt = [HumanMessage(content="Give me a title and count.")]
+
+    result = asyncio.run(structured.ainvoke_structured(prompt, _SampleOutput))
+
+    assert result == _SampleOutput(title="Native", count=1)
+    assert bound_schemas == [_SampleOutput]
+    assert stub.calls == []
+
+
+def test_ainvoke_structured_forwards_prompt_cache_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    stub = _StubChatModel(responses=['{"title": "Hello", "count": 1}'])
+    monkeypatch.setattr(structured, "get_llm", lambda *_, **__: stub)
+    key = structured.prompt_cache_key("You are a simulated persona.")
+
+    prompt = [HumanMessage(content="Give me a title and count.")]
+    asyncio.run(structured.ainvoke_structured(prompt, _SampleOutput, cache_key=key))
+
+    assert len(key) == 32
+    assert key == structured.prompt_cache_key("You are a simulated persona.")
+    assert stub.call_kwargs == [{"extra_body": {"prompt_cache_key": key}}]
@@ -11,6 +11,7 @@ from persona_sim.sim.prompts.persona_prompts import (
     build_persona_system_prompt,
     build_persona_user_prompt,
 )
+from persona_sim.sim.prompts.toon import encode_table
 
 
 def _persona() -> PersonaSpec:
@@ -79,3 +80,56 @@ def test_evaluator_prompt_requests_evaluation_report_json() -> None:
     assert "Return only valid JSON" in system_content
     assert "EvaluationReport JSON" in user_content
     assert "will_buy" in user_content
+
+
+def test_persona_system_prompt_reuses_cached_content_for_equal_specs() -> None:
+    persona = _persona()
+    scenario = _scenario()
+
+    first = build_persona_system_prompt(persona, scenario, mode="economic_buyer")[0].content
+    second = build_persona_system_prompt(
+        persona.model_copy(), scenario.model_copy(), mode="economic_buyer"
+    )[0].content
+    renamed = build_persona_system_prompt(
+        persona.model_copy(update={"name": "Sam Lee"}), scenario, mode="economic_buyer"
+    )[0].content
+
+    assert second is first
+    assert "Persona Sam Lee" in renamed
+
+
+def test_evaluator_prompt_encodes_personas_and_transcript_as_tables() -> None:
+    persona = _persona()
+    transcript = [
+        TranscriptEvent(
+            timestamp="2024-01-01T00:00:00Z",
+            actor="Jordan Taylor",
+            event_type=TranscriptEventType.ANSWER,
+            content="Cost | risk\nboth matter",
+        )
+    ]
+    user_content = build_evaluator_prompt(transcript, personas=[persona], scenario=_scenario())[
+        1
+    ].content
+
+    assert (
+        f"personas{{id|name|role|locale}}\n{persona.id}|Jordan Taylor|Head of Operations|UK"
+        in user_content
+    )
+    assert (
+        "transcript{timestamp|actor|type|content}\n"
+        "2024-01-01T00:00:00Z|Jordan Taylor|answer|Cost \\| risk\\nboth matter"
+    ) in user_content
+
+
+def test_evaluator_prompt_keeps_sentinels_for_empty_tables() -> None:
+    user_content = build_evaluator_prompt([], personas=[], scenario=_scenario())[1].content
+
+    assert "No personas provided." in user_content
+    assert "No transcript events recorded." in user_content
+    assert "transcript{" not in user_content
+    assert "personas{" not in user_content
+
+
+def test_encode_table_escapes_carriage_returns() -> None:
+    assert encode_table("t", ("a",), [("one\r\ntwo",)]) == "t{a}\none\\r\\ntwo"
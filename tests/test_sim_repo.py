@@ -1,22 +1,35 @@
 """Integration-style tests for the simulation repository."""
 
 import asyncio
+from typing import get_args
 from uuid import uuid4
 
+from sqlalchemy import event as sa_event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from persona_sim.db.base import Base
 from persona_sim.db.models import SimulationStatus
 from persona_sim.db.repositories import (
+    TranscriptBuffer,
     add_event,
     create_run,
     get_run,
     save_evaluation,
     set_status,
 )
-from persona_sim.schemas.eval import EvaluationReport, Objection, ObjectionCategory, ObjectionSeverity
+from persona_sim.schemas.eval import (
+    Category,
+    Decision,
+    EvaluationReport,
+    Objection,
+    ObjectionCategory,
+    ObjectionSeverity,
+    Severity,
+    WillDecision,
+)
 from persona_sim.schemas.persona import PersonaConstraints, PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
+from persona_sim.schemas.sim_state import SimulationState
 from persona_sim.schemas.transcript import TranscriptEvent, TranscriptEventType
 
 
@@ -104,6 +117,85 @@ async def _exercise_repository() -> None:
         assert state.outputs is not None
         assert state.transcript[0].actor == "system"
 
+        trusted = await get_run(session, run_id, trusted=True)
+        assert trusted is not None
+        assert trusted.scenario == fetched.scenario
+        assert trusted.personas == fetched.personas
+        assert trusted.evaluation == fetched.evaluation
+        assert (
+            trusted.to_simulation_state().model_dump_json(warnings="error")
+            == state.model_dump_json()
+        )
+
+        rebuilt = SimulationState.from_trusted(state.model_dump(mode="json"))
+        assert rebuilt == state
+        assert rebuilt.model_dump_json(warnings="error") == state.model_dump_json()
+
 
 def test_simulation_repository_crud() -> None:
     asyncio.run(_exercise_repository())
+
+
+async def _exercise_transcript_buffer() -> None:
+    session_factory = await _build_sessionmaker()
+    run_id = uuid4()
+    scenario = ScenarioSpec(id=uuid4(), title="Launch", context="Test context")
+    events = [
+        TranscriptEvent(
+            timestamp=f"2024-01-01T00:00:0{idx}Z",
+            actor="system",
+            event_type=TranscriptEventType.SYSTEM,
+            content=f"event {idx}",
+            meta={"idx": idx} if idx % 2 else None,
+        )
+        for idx in range(5)
+    ]
+
+    async with session_factory() as session:
+        await create_run(
+            session,
+            run_id=run_id,
+            scenario=scenario,
+            personas=[],
+            mode="playback",
+            model_name="gpt-4o-mini",
+            temperature=0.2,
+        )
+        async with TranscriptBuffer(session, run_id=run_id, batch_size=2) as buffer:
+            for event in events:
+                await buffer.add(event)
+        await session.commit()
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = session_factory.kw["bind"]
+    sa_event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        async with session_factory() as session:
+            fetched = await get_run(session, run_id)
+            assert fetched is not None
+            assert [event.content for event in fetched.transcript] == [e.content for e in events]
+            assert fetched.transcript[1].meta == {"idx": 1}
+    finally:
+        sa_event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    # The run, its transcript, and its evaluation load in one query each; reading the result
+    # must not lazy-load anything further.
+    assert len(statements) == 3
+
+
+def test_transcript_buffer_inserts_in_order() -> None:
+    asyncio.run(_exercise_transcript_buffer())
+
+
+def test_literal_fields_match_public_enums() -> None:
+    assert set(get_args(Category)) == {member.value for member in ObjectionCategory}
+    assert set(get_args(Severity)) == {member.value for member in ObjectionSeverity}
+    assert set(get_args(Decision)) == {member.value for member in WillDecision}
+
+    objection = Objection(category=ObjectionCategory.RISK, detail="d", severity="high")
+    assert objection.category == ObjectionCategory.RISK
+    assert objection.severity == ObjectionSeverity.HIGH
@@ -7,9 +7,11 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from persona_sim.core.config import get_settings
 from persona_sim.db.base import Base
 from persona_sim.db.models import SimulationRun, SimulationStatus
-from persona_sim.db.repositories import get_run
+from persona_sim.db.repositories import get_run, set_status
+from persona_sim.db.run_cache import get_cached_run
 from persona_sim.schemas.eval import EvaluationReport, WillDecision
 from persona_sim.schemas.persona import AuthorityLevel, PersonaConstraints, PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
@@ -54,27 +56,41 @@ def _scenario() -> ScenarioSpec:
     )
 
 
+_PERSONA_REPLY_JSON = (
+    '{"stance": "yes", "top_concerns": ["value"], "objections": [], '
+    '"required_proof": ["case study"], "short_answer": "Yes, I agree.", '
+    '"clarifying_questions": []}'
+)
+_EVALUATION_REPORT = EvaluationReport(
+    will_buy=WillDecision.YES,
+    will_use_daily=WillDecision.YES,
+    trust_delta=0.1,
+    top_objections=[],
+    required_proof=[],
+    recommended_next_steps=[],
+)
+
+
 async def _fake_persona_responder(*_) -> str:  # type: ignore[override]
-    return (
-        '{"stance": "yes", "top_concerns": ["value"], "objections": [], '
-        '"required_proof": ["case study"], "short_answer": "Yes, I agree.", '
-        '"clarifying_questions": []}'
-    )
+    return _PERSONA_REPLY_JSON
 
 
 async def _fake_evaluation_responder(*_) -> EvaluationReport:  # type: ignore[override]
-    return EvaluationReport(
-        will_buy=WillDecision.YES,
-        will_use_daily=WillDecision.YES,
-        trust_delta=0.1,
-        top_objections=[],
-        required_proof=[],
-        recommended_next_steps=[],
-    )
+    return _EVALUATION_REPORT
+
+
+# One event loop serves every test in this module instead of a fresh loop per _run call.
+_RUNNER = asyncio.Runner()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _close_runner():
+    yield
+    _RUNNER.close()
 
 
 def _run(coro):
-    return asyncio.run(coro)
+    return _RUNNER.run(coro)
 
 
 def test_start_run_validates_and_persists() -> None:
@@ -114,33 +130,28 @@ def test_start_run_rejects_invalid_inputs() -> None:
     persona = _persona("Buyer")
     stimulus = Stimulus(type=StimulusType.MESSAGE, content="Hello")
 
-    async def _run_call(**kwargs):
-        return await service.start_run(**kwargs)
-
-    with pytest.raises(ValidationError):
-        _run(
-            _run_call(
+    async def _start_invalid_runs() -> list[BaseException | object]:
+        return await asyncio.gather(
+            service.start_run(
                 scenario=scenario, personas=[], stimuli=[stimulus], run_mode="single-turn"
-            )
-        )
-
-    with pytest.raises(ValidationError):
-        _run(
-            _run_call(
+            ),
+            service.start_run(
                 scenario=scenario, personas=[persona], stimuli=[], run_mode="single-turn"
-            )
-        )
-
-    with pytest.raises(ValidationError):
-        _run(
-            _run_call(
+            ),
+            service.start_run(
                 scenario=scenario,
                 personas=[persona],
                 stimuli=[stimulus],
                 run_mode="invalid-mode",
-            )
+            ),
+            return_exceptions=True,
         )
 
+    results = _run(_start_invalid_runs())
+
+    assert len(results) == 3
+    assert all(isinstance(result, ValidationError) for result in results)
+
 
 def test_get_run_returns_projection() -> None:
     session_factory = _run(_session_factory())
@@ -167,6 +178,65 @@ def test_get_run_returns_projection() -> None:
     assert state.scenario.title == scenario.title
 
 
+def test_get_run_caches_finished_runs_until_written() -> None:
+    session_factory = _run(_session_factory())
+    service = SimulationService(
+        session_factory=session_factory,
+        persona_responder=_fake_persona_responder,
+        evaluation_responder=_fake_evaluation_responder,
+    )
+    run_id = _run(
+        service.start_run(
+            scenario=_scenario(),
+            personas=[_persona("Buyer")],
+            stimuli=[Stimulus(type=StimulusType.MESSAGE, content="Hello")],
+            run_mode="single-turn",
+        )
+    )
+
+    first = _run(service.get_run(run_id))
+    assert get_cached_run(run_id) is first
+    assert _run(service.get_run(run_id)) is first
+
+    async def _mark_failed() -> None:
+        async with session_factory() as session:
+            await set_status(session, run_id=run_id, status=SimulationStatus.FAILED)
+
+    _run(_mark_failed())
+    assert get_cached_run(run_id) is None
+
+
+def test_get_transcript_pages_with_cursor() -> None:
+    session_factory = _run(_session_factory())
+    service = SimulationService(
+        session_factory=session_factory,
+        persona_responder=_fake_persona_responder,
+        evaluation_responder=_fake_evaluation_responder,
+    )
+    run_id = _run(
+        service.start_run(
+            scenario=_scenario(),
+            personas=[_persona("Buyer")],
+            stimuli=[Stimulus(type=StimulusType.MESSAGE, content="Hello")],
+            run_mode="single-turn",
+        )
+    )
+
+    first = _run(service.get_transcript(run_id, limit=2))
+    assert [event.event_type.value for event in first.events] == ["system", "question"]
+    assert first.last_event_id is not None
+
+    rest = _run(service.get_transcript(run_id, since_event_id=first.last_event_id))
+    assert [event.event_type.value for event in rest.events] == ["answer", "evaluation"]
+
+    empty = _run(service.get_transcript(run_id, since_event_id=rest.last_event_id))
+    assert empty.events == []
+    assert empty.last_event_id == rest.last_event_id
+
+    with pytest.raises(NotFoundError):
+        _run(service.get_transcript(uuid4()))
+
+
 def test_get_run_not_found_raises() -> None:
     session_factory = _run(_session_factory())
     service = SimulationService(session_factory=session_factory)
@@ -244,3 +314,35 @@ def test_run_failure_marks_status_failed() -> None:
     run_record = _run(_fetch_last_run())
     assert run_record is not None
     assert run_record.status == SimulationStatus.FAILED
+
+
+def test_response_cache_is_sized_from_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PERSONA_RESPONSE_CACHE_SIZE", "8")
+    get_settings.cache_clear()
+    calls = 0
+
+    async def _counting_responder(*args) -> str:  # type: ignore[override]
+        nonlocal calls
+        calls += 1
+        return await _fake_persona_responder(*args)
+
+    try:
+        service = SimulationService(
+            session_factory=_run(_session_factory()),
+            persona_responder=_counting_responder,
+            evaluation_responder=_fake_evaluation_responder,
+        )
+    finally:
+        get_settings.cache_clear()
+    scenario = _scenario()
+    personas = [_persona("Buyer")]
+    stimuli = [Stimulus(type=StimulusType.MESSAGE, content="Hello")]
+
+    for _ in range(2):
+        _run(
+            service.start_run(
+                scenario=scenario, personas=personas, stimuli=stimuli, run_mode="single-turn"
+            )
+        )
+
+    assert calls == 1
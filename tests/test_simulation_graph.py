@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import json
+from pathlib import Path
 from uuid import uuid4
 
+import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from persona_sim.db.base import Base
+from persona_sim.db.models import SimulationRun as SimulationRunModel
 from persona_sim.db.models import SimulationStatus
-from persona_sim.db.repositories import get_run
+from persona_sim.db.models import TranscriptEvent as TranscriptEventModel
+from persona_sim.db.repositories import SimulationRunDTO, get_run
 from persona_sim.schemas.eval import (
     EvaluationReport,
     Objection,
@@ -21,13 +26,20 @@ from persona_sim.schemas.scenario import ScenarioSpec
 from persona_sim.schemas.sim_state import SimulationState
 from persona_sim.schemas.stimulus import Stimulus, StimulusType
 from persona_sim.schemas.transcript import TranscriptEventType
+from persona_sim.sim.graph import nodes as graph_nodes
 from persona_sim.sim.graph.graph import build_simulation_graph
-from persona_sim.sim.graph.nodes import GraphDependencies
+from persona_sim.sim.graph.nodes import (
+    GraphDependencies,
+    persona_response_node,
+    update_state_node,
+)
 from persona_sim.sim.graph.state import GraphState, RunConfig, RunMode, TurnInput
 
 
-async def _session_factory() -> async_sessionmaker:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
+async def _session_factory(
+    database_url: str = "sqlite+aiosqlite:///:memory:",
+) -> async_sessionmaker:
+    engine = create_async_engine(database_url, future=True)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     return async_sessionmaker(engine, expire_on_commit=False)
@@ -87,25 +99,47 @@ async def _fake_persona_responder(
     )
 
 
+_EVALUATION_REPORT = EvaluationReport(
+    will_buy=WillDecision.YES,
+    will_use_daily=WillDecision.RELUCTANT,
+    trust_delta=0.2,
+    top_objections=[
+        Objection(
+            category=ObjectionCategory.COST,
+            detail="Too expensive",
+            severity=ObjectionSeverity.MEDIUM,
+        )
+    ],
+    required_proof=["pricing benchmark"],
+    recommended_next_steps=["share case study"],
+)
+
+
 async def _fake_evaluation_responder(messages) -> EvaluationReport:  # type: ignore[override]
-    return EvaluationReport(
-        will_buy=WillDecision.YES,
-        will_use_daily=WillDecision.RELUCTANT,
-        trust_delta=0.2,
-        top_objections=[
-            Objection(
-                category=ObjectionCategory.COST,
-                detail="Too expensive",
-                severity=ObjectionSeverity.MEDIUM,
-            )
-        ],
-        required_proof=["pricing benchmark"],
-        recommended_next_steps=["share case study"],
-    )
-
-
-async def _run_graph(mode: RunMode) -> tuple[GraphState, async_sessionmaker]:
-    session_factory = await _session_factory()
+    return _EVALUATION_REPORT
+
+
+_LAUNCH_TURN = TurnInput(stimulus=Stimulus(type=StimulusType.MESSAGE, content="Launch"))
+_INITIAL_TURN = TurnInput(
+    stimulus=Stimulus(type=StimulusType.MESSAGE, content="Launch"), question="Initial question"
+)
+_FOLLOW_UP_STIMULUS = Stimulus(type=StimulusType.FEATURE, content="Follow-up feature")
+_RUN_TURNS = {
+    RunMode.SINGLE_TURN: [_INITIAL_TURN, TurnInput(stimulus=_FOLLOW_UP_STIMULUS)],
+    RunMode.MULTI_TURN: [
+        _INITIAL_TURN,
+        TurnInput(stimulus=_FOLLOW_UP_STIMULUS, question="Follow-up detail"),
+    ],
+}
+
+
+async def _run_graph(
+    mode: RunMode,
+    *,
+    session_factory: async_sessionmaker | None = None,
+    evaluation_responder=_fake_evaluation_responder,
+) -> tuple[GraphState, SimulationRunDTO | None]:
+    session_factory = session_factory or await _session_factory()
     personas = [_persona("Buyer"), _persona("User")]
     scenario = _scenario()
     run_id = uuid4()
@@ -114,16 +148,7 @@ async def _run_graph(mode: RunMode) -> tuple[GraphState, async_sessionmaker]:
         model_name="gpt-4o-mini",
         temperature=0.0,
         mode=mode,
-        turns=[
-            TurnInput(
-                stimulus=Stimulus(type=StimulusType.MESSAGE, content="Launch"),
-                question="Initial question",
-            ),
-            TurnInput(
-                stimulus=Stimulus(type=StimulusType.FEATURE, content="Follow-up feature"),
-                question="Follow-up detail" if mode == RunMode.MULTI_TURN else None,
-            ),
-        ],
+        turns=_RUN_TURNS[mode],
         persona_modes={personas[0].id: "economic_buyer", personas[1].id: "daily_user"},
     )
     initial_state = GraphState(
@@ -143,39 +168,60 @@ async def _run_graph(mode: RunMode) -> tuple[GraphState, async_sessionmaker]:
     deps = GraphDependencies(
         session_factory=session_factory,
         persona_responder=_fake_persona_responder,
-        evaluation_responder=_fake_evaluation_responder,
+        evaluation_responder=evaluation_responder,
     )
     graph = build_simulation_graph(deps).compile()
     result = await graph.ainvoke(initial_state)
-    validated = GraphState.model_validate(result)
-    return validated, session_factory
+    # Read the stored run back on the same loop and connection that wrote it.
+    async with session_factory() as session:
+        run = await get_run(session, run_id)
+    return GraphState(**result), run
+
+
+def test_run_config_rejects_out_of_range_temperature() -> None:
+    with pytest.raises(ValueError, match="temperature"):
+        RunConfig(run_id=uuid4(), model_name="gpt-4o-mini", temperature=1.5)
+
+
+def test_run_config_coerces_mode_values() -> None:
+    config = RunConfig(
+        run_id=uuid4(),
+        model_name="gpt-4o-mini",
+        temperature=0.0,
+        mode="single-turn",  # type: ignore[arg-type]
+        turns=[_LAUNCH_TURN, _LAUNCH_TURN],
+    )
+
+    assert config.mode is RunMode.SINGLE_TURN
+    assert config.max_turns == 1
+    with pytest.raises(ValueError):
+        RunConfig(
+            run_id=uuid4(),
+            model_name="gpt-4o-mini",
+            temperature=0.0,
+            mode="sideways",  # type: ignore[arg-type]
+        )
 
 
 def test_single_turn_graph_executes_and_updates_state() -> None:
-    state, session_factory = asyncio.run(_run_graph(RunMode.SINGLE_TURN))
+    state, run = asyncio.run(_run_graph(RunMode.SINGLE_TURN))
 
     assert state.simulation.outputs is not None
     assert state.simulation.outputs.will_buy == WillDecision.YES
     persona_state = state.simulation.persona_states[next(iter(state.simulation.persona_states))]
-    assert persona_state.trust_state.trust_score > 0.5
+    assert persona_state.trust_state["trust_score"] > 0.5
     assert state.current_turn == 1
     assert any(
         event.event_type == TranscriptEventType.EVALUATION
         for event in state.simulation.transcript
     )
-
-    async def _validate() -> None:
-        async with session_factory() as session:
-            run = await get_run(session, state.simulation.run_id)
-            assert run is not None
-            assert run.status == SimulationStatus.COMPLETED
-            assert len(run.transcript) == 5
-
-    asyncio.run(_validate())
+    assert run is not None
+    assert run.status == SimulationStatus.COMPLETED
+    assert len(run.transcript) == 5
 
 
 def test_multi_turn_runs_all_turns_and_persists() -> None:
-    state, session_factory = asyncio.run(_run_graph(RunMode.MULTI_TURN))
+    state, run = asyncio.run(_run_graph(RunMode.MULTI_TURN))
 
     assert state.current_turn == 2
     assert len(state.simulation.transcript) == 8
@@ -184,17 +230,24 @@ def test_multi_turn_runs_all_turns_and_persists() -> None:
     first_persona_state = state.simulation.persona_states[
         next(iter(state.simulation.persona_states))
     ]
-    assert first_persona_state.trust_state.trust_score < 0.5
-    assert first_persona_state.trust_state.fatigue_score >= 0.05
-
-    async def _validate() -> None:
-        async with session_factory() as session:
-            run = await get_run(session, state.simulation.run_id)
-            assert run is not None
-            assert run.status == SimulationStatus.COMPLETED
-            assert len(run.transcript) == 8
+    assert first_persona_state.trust_state["trust_score"] < 0.5
+    assert first_persona_state.trust_state["fatigue_score"] >= 0.05
+    assert run is not None
+    assert run.status == SimulationStatus.COMPLETED
+    assert len(run.transcript) == 8
+    answer = next(
+        event for event in run.transcript if event.event_type == TranscriptEventType.ANSWER
+    )
+    assert answer.meta["raw"]["stance"] == "yes"
+    assert answer.meta["raw"]["short_answer"] == "ok"
 
-    asyncio.run(_validate())
+    in_memory_answer = next(
+        event
+        for event in state.simulation.transcript
+        if event.event_type == TranscriptEventType.ANSWER
+    )
+    assert in_memory_answer.meta["raw"]["stance"] == "yes"
+    assert json.loads(in_memory_answer.model_dump_json())["meta"]["raw"]["short_answer"] == "ok"
 
 
 def test_transcript_marks_steps_and_evaluates_once() -> None:
@@ -226,3 +279,269 @@ def test_transcript_marks_steps_and_evaluates_once() -> None:
     ]
     assert len(evaluation_events) == 1
     assert state.simulation.transcript[-1] == evaluation_events[0]
+
+
+async def _persona_turn_peak(persona_concurrency: int) -> tuple[int, list[str]]:
+    in_flight = 0
+    peak = 0
+
+    async def _tracking_responder(messages, model_name: str, temperature: float) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await _fake_persona_responder(messages, model_name, temperature)
+
+    personas = [_persona(f"Persona {idx}") for idx in range(3)]
+    run_id = uuid4()
+    state = GraphState(
+        simulation=SimulationState(run_id=run_id, scenario=_scenario(), personas=personas),
+        config=RunConfig(
+            run_id=run_id,
+            model_name="gpt-4o-mini",
+            temperature=0.0,
+            mode=RunMode.SINGLE_TURN,
+            turns=[_LAUNCH_TURN],
+        ),
+    )
+    deps = GraphDependencies(
+        session_factory=await _session_factory(),
+        persona_responder=_tracking_responder,
+        persona_concurrency=persona_concurrency,
+    )
+    result = await persona_response_node(state, deps)
+    answers = [
+        event.actor
+        for event in result.simulation.transcript
+        if event.event_type == TranscriptEventType.ANSWER
+    ]
+    return peak, answers
+
+
+def test_persona_responses_run_concurrently_within_limit() -> None:
+    expected_order = ["Persona 0", "Persona 1", "Persona 2"]
+
+    peak, answers = asyncio.run(_persona_turn_peak(persona_concurrency=3))
+    assert peak == 3
+    assert answers == expected_order
+
+    peak, answers = asyncio.run(_persona_turn_peak(persona_concurrency=1))
+    assert peak == 1
+    assert answers == expected_order
+
+
+async def _failing_turn() -> tuple[type[BaseException], list[str]]:
+    finished: list[str] = []
+
+    async def _responder(messages, model_name: str, temperature: float) -> str:
+        prompt_text = " ".join(getattr(message, "content", "") for message in messages)
+        if "Persona 0" in prompt_text:
+            raise RuntimeError("provider unavailable")
+        await asyncio.sleep(0.01)
+        finished.append("done")
+        return await _fake_persona_responder(messages, model_name, temperature)
+
+    personas = [_persona(f"Persona {idx}") for idx in range(3)]
+    run_id = uuid4()
+    state = GraphState(
+        simulation=SimulationState(run_id=run_id, scenario=_scenario(), personas=personas),
+        config=RunConfig(
+            run_id=run_id,
+            model_name="gpt-4o-mini",
+            temperature=0.0,
+            mode=RunMode.SINGLE_TURN,
+            turns=[_LAUNCH_TURN],
+        ),
+    )
+    deps = GraphDependencies(session_factory=await _session_factory(), persona_responder=_responder)
+    try:
+        await persona_response_node(state, deps)
+    except RuntimeError as exc:
+        return type(exc), finished
+    raise AssertionError("persona_response_node should propagate responder failures")
+
+
+def test_persona_response_failure_propagates_after_all_calls_settle() -> None:
+    error_type, finished = asyncio.run(_failing_turn())
+
+    assert error_type is RuntimeError
+    assert finished == ["done", "done"]
+
+
+def test_persona_system_prompts_are_built_once_per_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    original = graph_nodes.build_persona_system_prompt
+
+    def _counting_builder(persona, scenario, mode):
+        calls.append(persona.name)
+        return original(persona, scenario, mode)
+
+    monkeypatch.setattr(graph_nodes, "build_persona_system_prompt", _counting_builder)
+    state, _ = asyncio.run(_run_graph(RunMode.MULTI_TURN))
+
+    assert state.current_turn == 2
+    assert sorted(calls) == ["Buyer", "User"]
+
+
+async def _turns_with_response_cache() -> tuple[int, int]:
+    calls = 0
+
+    async def _counting_responder(messages, model_name: str, temperature: float) -> str:
+        nonlocal calls
+        calls += 1
+        return await _fake_persona_responder(messages, model_name, temperature)
+
+    personas = [_persona("Buyer"), _persona("User")]
+    scenario = _scenario()
+    deps = GraphDependencies(
+        session_factory=await _session_factory(),
+        persona_responder=_counting_responder,
+        response_cache={},
+    )
+
+    answers = 0
+    for _ in range(2):
+        run_id = uuid4()
+        state = GraphState(
+            simulation=SimulationState(run_id=run_id, scenario=scenario, personas=personas),
+            config=RunConfig(
+                run_id=run_id,
+                model_name="gpt-4o-mini",
+                temperature=0.0,
+                mode=RunMode.SINGLE_TURN,
+                turns=[_LAUNCH_TURN],
+            ),
+        )
+        result = await persona_response_node(state, deps)
+        answers += len(result.latest_responses)
+    return calls, answers
+
+
+def test_response_cache_skips_responder_for_repeated_prompts() -> None:
+    calls, answers = asyncio.run(_turns_with_response_cache())
+
+    assert answers == 4
+    assert calls == 2
+
+
+async def _turn_with_unusable_replies() -> GraphState:
+    replies = iter(["   ", "not-json"])
+
+    async def _unusable_responder(messages, model_name: str, temperature: float) -> str:
+        return next(replies)
+
+    personas = [_persona("Buyer"), _persona("User")]
+    run_id = uuid4()
+    state = GraphState(
+        simulation=SimulationState(run_id=run_id, scenario=_scenario(), personas=personas),
+        config=RunConfig(
+            run_id=run_id,
+            model_name="gpt-4o-mini",
+            temperature=0.0,
+            mode=RunMode.SINGLE_TURN,
+            turns=[_LAUNCH_TURN],
+        ),
+    )
+    deps = GraphDependencies(
+        session_factory=await _session_factory(),
+        persona_responder=_unusable_responder,
+        response_cache={},
+    )
+    result = await persona_response_node(state, deps)
+    assert deps.response_cache == {}
+    return await update_state_node(result)
+
+
+def test_unusable_persona_replies_fall_back_without_another_llm_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _unexpected_call(*_: object) -> None:
+        raise AssertionError("parser must not re-invoke the LLM")
+
+    monkeypatch.setattr(graph_nodes, "ainvoke_structured", _unexpected_call)
+
+    result = asyncio.run(_turn_with_unusable_replies())
+
+    assert [response.stance for response in result.latest_responses] == [
+        WillDecision.RELUCTANT,
+        WillDecision.RELUCTANT,
+    ]
+    assert [response.content for response in result.latest_responses] == ["", ""]
+    answers = [
+        event
+        for event in result.simulation.transcript
+        if event.event_type == TranscriptEventType.ANSWER
+    ]
+    assert [(event.meta["fallback"], event.meta["reason"]) for event in answers] == [
+        (True, "empty"),
+        (True, "invalid"),
+    ]
+    assert all("raw" not in event.meta for event in answers)
+    # Fallbacks carry no signal, so no trust or fatigue state is created or moved for them.
+    assert result.simulation.persona_states == {}
+
+
+async def _events_persisted_during_evaluation(database_url: str) -> tuple[int, int]:
+    # A file database gives each session its own connection, as a real deployment would.
+    session_factory = await _session_factory(database_url)
+    seen: list[int] = []
+
+    async def _stored_event_count() -> int:
+        async with session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(TranscriptEventModel))
+
+    async def _observing_evaluation_responder(messages) -> EvaluationReport:
+        for _ in range(50):
+            if await _stored_event_count():
+                break
+            await asyncio.sleep(0.01)
+        seen.append(await _stored_event_count())
+        return await _fake_evaluation_responder(messages)
+
+    await _run_graph(
+        RunMode.MULTI_TURN,
+        session_factory=session_factory,
+        evaluation_responder=_observing_evaluation_responder,
+    )
+    return seen[0], await _stored_event_count()
+
+
+def test_transcript_is_persisted_while_evaluator_runs(tmp_path: Path) -> None:
+    during_evaluation, final = asyncio.run(
+        _events_persisted_during_evaluation(f"sqlite+aiosqlite:///{tmp_path / 'pipeline.db'}")
+    )
+
+    assert during_evaluation == 7
+    assert final == 8
+
+
+async def _run_with_failing_evaluator() -> tuple[SimulationRunDTO | None, int]:
+    session_factory = await _session_factory()
+
+    async def _failing_evaluation_responder(messages) -> EvaluationReport:
+        raise RuntimeError("evaluator unavailable")
+
+    with pytest.raises(RuntimeError, match="evaluator unavailable"):
+        await _run_graph(
+            RunMode.MULTI_TURN,
+            session_factory=session_factory,
+            evaluation_responder=_failing_evaluation_responder,
+        )
+
+    async with session_factory() as session:
+        run_id = await session.scalar(select(SimulationRunModel.run_id))
+        run = await get_run(session, run_id)
+        stored = await session.scalar(select(func.count()).select_from(TranscriptEventModel))
+    return run, stored
+
+
+def test_failed_evaluator_leaves_pre_evaluation_transcript_committed() -> None:
+    # The pre-evaluation transcript commits on its own, so it stays readable after a failure.
+    run, stored = asyncio.run(_run_with_failing_evaluator())
+
+    assert run is not None
+    assert stored == 7
+    assert run.status != SimulationStatus.COMPLETED
+    assert run.evaluation is None
+    assert all(event.event_type != TranscriptEventType.EVALUATION for event in run.transcript)
@@ -11,10 +11,49 @@ from persona_sim.schemas.eval import EvaluationReport, WillDecision
 from persona_sim.schemas.persona import AuthorityLevel, PersonaConstraints, PersonaSpec
 from persona_sim.schemas.scenario import ScenarioSpec
 from persona_sim.schemas.sim_state import SimulationState
-from persona_sim.schemas.stimulus import Stimulus, StimulusType
+from persona_sim.schemas.stimulus import StimulusType
 from persona_sim.schemas.transcript import TranscriptEvent, TranscriptEventType
 from persona_sim.sim.errors import NotFoundError
 
+_CREATE_PAYLOAD_TEMPLATE = {
+    "scenario": {
+        "title": "Launch feature",
+        "context": "Validate feature launch",
+        "stressors": ["timeline"],
+        "success_criteria": ["adoption"],
+    },
+    "persona": {
+        "name": "Buyer",
+        "role": "Lead",
+        "sector": "Tech",
+        "locale": "UK",
+        "incentives": ["value"],
+        "fears": ["risk"],
+        "constraints": {
+            "time_per_week_minutes": 60,
+            "budget_gbp": 5000,
+            "ai_trust_level": 4,
+            "authority_level": "medium",
+        },
+        "communication_style": "direct",
+    },
+    "stimuli": [{"type": StimulusType.MESSAGE.value, "content": "Hello"}],
+    "run_mode": "single-turn",
+    "steps": 1,
+}
+
+
+def _create_payload() -> dict:
+    # Only the ids vary per request; everything else comes from the shared template.
+    template = _CREATE_PAYLOAD_TEMPLATE
+    return {
+        "scenario": {"id": str(uuid4()), **template["scenario"]},
+        "personas": [{"id": str(uuid4()), **template["persona"]}],
+        "stimuli": template["stimuli"],
+        "run_mode": template["run_mode"],
+        "steps": template["steps"],
+    }
+
 
 class StubSimulationService:
     def __init__(self) -> None:
@@ -82,7 +121,7 @@ class StubSimulationService:
         )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def stub_service() -> StubSimulationService:
     stub = StubSimulationService()
     app.dependency_overrides[get_simulation_service] = lambda: stub
@@ -90,44 +129,18 @@ def stub_service() -> StubSimulationService:
     app.dependency_overrides.clear()
 
 
-@pytest.fixture()
+@pytest.fixture(autouse=True)
+def _reset_stub_payload(stub_service: StubSimulationService) -> None:
+    stub_service.last_payload = None
+
+
+@pytest.fixture(scope="module")
 def client(stub_service: StubSimulationService) -> TestClient:  # noqa: ARG001
     return TestClient(app)
 
 
 def test_create_simulation_returns_run_id(client: TestClient, stub_service: StubSimulationService) -> None:
-    payload = {
-        "scenario": {
-            "id": str(uuid4()),
-            "title": "Launch feature",
-            "context": "Validate feature launch",
-            "stressors": ["timeline"],
-            "success_criteria": ["adoption"],
-        },
-        "personas": [
-            {
-                "id": str(uuid4()),
-                "name": "Buyer",
-                "role": "Lead",
-                "sector": "Tech",
-                "locale": "UK",
-                "incentives": ["value"],
-                "fears": ["risk"],
-                "constraints": {
-                    "time_per_week_minutes": 60,
-                    "budget_gbp": 5000,
-                    "ai_trust_level": 4,
-                    "authority_level": "medium",
-                },
-                "communication_style": "direct",
-            }
-        ],
-        "stimuli": [{"type": StimulusType.MESSAGE.value, "content": "Hello"}],
-        "run_mode": "single-turn",
-        "steps": 1,
-    }
-
-    response = client.post("/v1/simulations", json=payload)
+    response = client.post("/v1/simulations", json=_create_payload())
 
     assert response.status_code == 201
     assert response.json()["run_id"] == str(stub_service.run_id)